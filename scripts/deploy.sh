@@ -130,6 +130,10 @@ config_manager.create_default_configs()
 print('Default configuration files created.')
 "
 
+# Precompress static assets for nginx gzip_static
+log "Precompressing static assets..."
+find src/static -type f \( -name '*.js' -o -name '*.css' \) -exec gzip -9 -k -f {} \;
+
 # Build and start services
 log "Building Docker images..."
 docker-compose build
@@ -102,6 +102,10 @@ log "Successfully pulled latest changes"
 log "Stopping current Docker services..."
 docker-compose down
 
+# Precompress static assets for nginx gzip_static
+log "Precompressing static assets..."
+find src/static -type f \( -name '*.js' -o -name '*.css' \) -exec gzip -9 -k -f {} \;
+
 # Build new images
 log "Building new Docker images..."
 docker-compose build --no-cache
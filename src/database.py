@@ -20,16 +20,24 @@ class DatabaseManager:
     """Manages SQLite database operations"""
     
     def __init__(self, db_path: str = "data/vulcan_sentinel.db"):
+        # db_path may also be an SQLite URI, e.g. "file:test?mode=memory&cache=shared"
         self.db_path = db_path
         self._ensure_data_directory()
         self._init_connection()
         
+        # A shared in-memory database only lives while a connection to it is open,
+        # and every operation below opens and closes its own
+        self._memory_keepalive = None
+        if db_path.startswith('file:') and 'mode=memory' in db_path:
+            self._memory_keepalive = sqlite3.connect(db_path, uri=True, check_same_thread=False)
+        
         # Set timezone to CST to match other components
         self.cst_tz = pytz.timezone('America/Chicago')
     
     def _ensure_data_directory(self):
         """Ensure the data directory exists"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        if not self.db_path.startswith('file:'):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
     
     def _init_connection(self):
         """Initialize database connection with connection pooling"""
@@ -43,7 +51,8 @@ class DatabaseManager:
     def _get_connection(self):
         """Get a new database connection for thread safety"""
         try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # uri=True leaves plain file paths unchanged
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, uri=True)
             conn.row_factory = sqlite3.Row  # Enable dict-like access
             
             # Enable WAL mode for better concurrency
@@ -89,10 +98,14 @@ class DatabaseManager:
                     preheat REAL,
                     main_heat REAL,
                     rib_heat REAL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    ts_epoch INTEGER
                 )
             """)
             
+            # Add and backfill ts_epoch on databases created before it existed
+            self._migrate_readings_epoch(cursor)
+            
             # Create setpoints table for storing temperature setpoints
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS setpoints (
@@ -128,6 +141,11 @@ class DatabaseManager:
                 ON readings (date)
             """)
             
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_readings_ts_epoch 
+                ON readings (ts_epoch)
+            """)
+            
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_events_timestamp 
                 ON events (timestamp)
@@ -158,6 +176,33 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    def _to_epoch(self, dt: datetime) -> int:
+        """Convert a datetime to epoch seconds, treating naive values as CST wall-clock time"""
+        if dt.tzinfo is None:
+            dt = self.cst_tz.localize(dt)
+        return int(dt.timestamp())
+    
+    def _migrate_readings_epoch(self, cursor):
+        """Add the ts_epoch column to readings and fill it in for rows that lack it"""
+        cursor.execute("PRAGMA table_info(readings)")
+        if 'ts_epoch' not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE readings ADD COLUMN ts_epoch INTEGER")
+            logger.info("Added ts_epoch column to readings table")
+        
+        cursor.execute("SELECT id, date, timestamp FROM readings WHERE ts_epoch IS NULL")
+        rows = cursor.fetchall()
+        if not rows:
+            return
+        
+        # date/timestamp hold CST wall-clock strings; ts_epoch is the matching UTC epoch
+        updates = []
+        for row_id, date_str, time_str in rows:
+            reading_time = datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M:%S')
+            updates.append((self._to_epoch(reading_time), row_id))
+        
+        cursor.executemany("UPDATE readings SET ts_epoch = ? WHERE id = ?", updates)
+        logger.info(f"Backfilled ts_epoch for {len(updates)} readings")
+    
     def store_readings(self, device_name: str, timestamp: datetime, readings: Dict[str, float]):
         """Store readings for a device in the new format"""
         conn = None
@@ -169,6 +214,7 @@ class DatabaseManager:
             cst_timestamp = timestamp.astimezone(self.cst_tz)
             date_str = cst_timestamp.strftime('%Y-%m-%d')
             time_str = cst_timestamp.strftime('%H:%M:%S')
+            ts_epoch = int(cst_timestamp.timestamp())
             
             # Check if we already have a reading for this exact timestamp
             cursor.execute("""
@@ -206,19 +252,19 @@ class DatabaseManager:
                 # Insert new record - only set the column for this specific device
                 if device_name == 'preheat':
                     cursor.execute("""
-                        INSERT INTO readings (date, timestamp, preheat, main_heat, rib_heat)
-                        VALUES (?, ?, ?, NULL, NULL)
-                    """, (date_str, time_str, temperature_value))
+                        INSERT INTO readings (date, timestamp, preheat, main_heat, rib_heat, ts_epoch)
+                        VALUES (?, ?, ?, NULL, NULL, ?)
+                    """, (date_str, time_str, temperature_value, ts_epoch))
                 elif device_name == 'main_heat':
                     cursor.execute("""
-                        INSERT INTO readings (date, timestamp, preheat, main_heat, rib_heat)
-                        VALUES (?, ?, NULL, ?, NULL)
-                    """, (date_str, time_str, temperature_value))
+                        INSERT INTO readings (date, timestamp, preheat, main_heat, rib_heat, ts_epoch)
+                        VALUES (?, ?, NULL, ?, NULL, ?)
+                    """, (date_str, time_str, temperature_value, ts_epoch))
                 elif device_name == 'rib_heat':
                     cursor.execute("""
-                        INSERT INTO readings (date, timestamp, preheat, main_heat, rib_heat)
-                        VALUES (?, ?, NULL, NULL, ?)
-                    """, (date_str, time_str, temperature_value))
+                        INSERT INTO readings (date, timestamp, preheat, main_heat, rib_heat, ts_epoch)
+                        VALUES (?, ?, NULL, NULL, ?, ?)
+                    """, (date_str, time_str, temperature_value, ts_epoch))
             
             conn.commit()
             logger.debug(f"Stored readings for {device_name} at {date_str} {time_str}")
@@ -232,6 +278,67 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    def store_readings_bulk(self, rows: List[tuple]):
+        """Store many (timestamp, {sensor: temperature}) rows in a single transaction
+
+        Rows merge into an existing reading with the same date and time the same
+        way store_readings does; sensors missing from a row are left untouched.
+        """
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            # Merge rows that share a date and time first; otherwise the INSERT below
+            # would skip every row after the first one for that key
+            merged = {}
+            for timestamp, temperatures in rows:
+                cst_timestamp = timestamp.astimezone(self.cst_tz)
+                date_str = cst_timestamp.strftime('%Y-%m-%d')
+                time_str = cst_timestamp.strftime('%H:%M:%S')
+                row = merged.setdefault((date_str, time_str), {
+                    'date': date_str,
+                    'time': time_str,
+                    'ts_epoch': int(cst_timestamp.timestamp()),
+                    'preheat': None,
+                    'main_heat': None,
+                    'rib_heat': None
+                })
+                # Later values win, as with successive store_readings calls
+                for sensor in ('preheat', 'main_heat', 'rib_heat'):
+                    if temperatures.get(sensor) is not None:
+                        row[sensor] = temperatures[sensor]
+            params = list(merged.values())
+            
+            # Fill in rows that already exist, then insert the rest; both statements
+            # look rows up through the (date, timestamp) index
+            cursor.executemany("""
+                UPDATE readings
+                SET preheat = COALESCE(:preheat, preheat),
+                    main_heat = COALESCE(:main_heat, main_heat),
+                    rib_heat = COALESCE(:rib_heat, rib_heat)
+                WHERE date = :date AND timestamp = :time
+            """, params)
+            cursor.executemany("""
+                INSERT INTO readings (date, timestamp, preheat, main_heat, rib_heat, ts_epoch)
+                SELECT :date, :time, :preheat, :main_heat, :rib_heat, :ts_epoch
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM readings WHERE date = :date AND timestamp = :time
+                )
+            """, params)
+            
+            conn.commit()
+            logger.debug(f"Stored {len(params)} bulk readings")
+            
+        except Exception as e:
+            logger.error(f"Failed to store bulk readings: {e}")
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if conn:
+                conn.close()
+    
     def get_latest_readings(self, device_name: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get the latest readings for all devices or a specific device using new schema"""
         conn = None
@@ -347,42 +454,17 @@ class DatabaseManager:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            # Convert timezone-aware datetime objects to naive datetime objects for database comparison
-            # since the database stores naive datetime strings
-            if start_time.tzinfo is not None:
-                start_time = start_time.replace(tzinfo=None)
-            if end_time.tzinfo is not None:
-                end_time = end_time.replace(tzinfo=None)
-            
-            logger.info(f"Querying database for {device_name} from {start_time} to {end_time}")
-            
-            # Convert datetime objects to date and time strings for the new schema
-            start_date = start_time.strftime('%Y-%m-%d')
-            start_time_str = start_time.strftime('%H:%M:%S')
-            end_date = end_time.strftime('%Y-%m-%d')
-            end_time_str = end_time.strftime('%H:%M:%S')
+            logger.debug(f"Querying database for {device_name} from {start_time} to {end_time}")
             
-            # Query based on the new schema with date and timestamp columns
-            if start_date == end_date:
-                # Same day query
-                cursor.execute("""
-                    SELECT date, timestamp, preheat, main_heat, rib_heat
-                    FROM readings
-                    WHERE date = ? AND timestamp BETWEEN ? AND ?
-                    ORDER BY date ASC, timestamp ASC
-                """, (start_date, start_time_str, end_time_str))
-            else:
-                # Cross-day query
-                cursor.execute("""
-                    SELECT date, timestamp, preheat, main_heat, rib_heat
-                    FROM readings
-                    WHERE (date > ? OR (date = ? AND timestamp >= ?))
-                    AND (date < ? OR (date = ? AND timestamp <= ?))
-                    ORDER BY date ASC, timestamp ASC
-                """, (start_date, start_date, start_time_str, end_date, end_date, end_time_str))
+            cursor.execute("""
+                SELECT date, timestamp, preheat, main_heat, rib_heat
+                FROM readings
+                WHERE ts_epoch BETWEEN ? AND ?
+                ORDER BY ts_epoch ASC
+            """, (self._to_epoch(start_time), self._to_epoch(end_time)))
             
             results = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 date_str, time_str, preheat, main_heat, rib_heat = row
                 
                 # Create a result dict that matches the expected format
@@ -410,11 +492,11 @@ class DatabaseManager:
                     }
                     results.append(result)
             
-            logger.info(f"Database query returned {len(results)} results for {device_name}")
+            logger.debug(f"Database query returned {len(results)} results for {device_name}")
             
             # Log a few sample timestamps if we have results
-            if results:
-                logger.info(f"Sample timestamps: {results[0]['timestamp']} to {results[-1]['timestamp']}")
+            if results and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Sample timestamps: {results[0]['timestamp']} to {results[-1]['timestamp']}")
             
             return results
             
@@ -454,7 +536,7 @@ class DatabaseManager:
             """, (device_name, start_time, end_time))
             
             stats = {}
-            for row in cursor.fetchall():
+            for row in cursor:
                 register_name = row['register_name']
                 stats[register_name] = {
                     'count': row['count'],
@@ -494,6 +576,27 @@ class DatabaseManager:
             if conn:
                 conn.close()
     
+    def log_events_bulk(self, events: List[tuple]):
+        """Log many (event_type, message, severity, device_name) events in a single transaction"""
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.executemany("""
+                INSERT INTO events (event_type, message, severity, device_name)
+                VALUES (?, ?, ?, ?)
+            """, events)
+            
+            conn.commit()
+            logger.debug(f"Logged {len(events)} events")
+            
+        except Exception as e:
+            logger.error(f"Failed to log events: {e}")
+        finally:
+            if conn:
+                conn.close()
+    
     def get_events(self, limit: int = 100, severity: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get recent system events"""
         conn = None
@@ -516,7 +619,7 @@ class DatabaseManager:
                 """, (limit,))
             
             results = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 results.append(dict(row))
             
             return results
@@ -539,8 +642,8 @@ class DatabaseManager:
             # Delete old readings
             cursor.execute("""
                 DELETE FROM readings
-                WHERE timestamp < ?
-            """, (cutoff_date,))
+                WHERE ts_epoch < ?
+            """, (int(cutoff_date.timestamp()),))
             
             readings_deleted = cursor.rowcount
             
@@ -640,7 +743,7 @@ class DatabaseManager:
             """)
             
             setpoints = {}
-            for row in cursor.fetchall():
+            for row in cursor:
                 device_name, setpoint_value, deviation, timestamp = row
                 setpoints[device_name] = {
                     'setpoint_value': setpoint_value,
@@ -716,7 +819,7 @@ class DatabaseManager:
             """, (device_name, start_datetime_str, end_datetime_str))
             
             setpoint_history = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 setpoint_value, timestamp = row
                 setpoint_history.append({
                     'setpoint_value': setpoint_value,
@@ -789,34 +892,16 @@ class DatabaseManager:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            # Convert datetime objects to string format for database query
-            start_date = start_time.strftime('%Y-%m-%d')
-            start_timestamp = start_time.strftime('%H:%M:%S')
-            end_date = end_time.strftime('%Y-%m-%d')
-            end_timestamp = end_time.strftime('%H:%M:%S')
-            
             # Query readings within the time period
-            if start_date == end_date:
-                # Same day query
-                cursor.execute("""
-                    SELECT date, timestamp, preheat, main_heat, rib_heat
-                    FROM readings
-                    WHERE date = ? AND timestamp BETWEEN ? AND ?
-                    ORDER BY date, timestamp
-                """, (start_date, start_timestamp, end_timestamp))
-            else:
-                # Cross-day query
-                cursor.execute("""
-                    SELECT date, timestamp, preheat, main_heat, rib_heat
-                    FROM readings
-                    WHERE (date = ? AND timestamp >= ?) OR 
-                          (date > ? AND date < ?) OR
-                          (date = ? AND timestamp <= ?)
-                    ORDER BY date, timestamp
-                """, (start_date, start_timestamp, start_date, end_date, end_date, end_timestamp))
+            cursor.execute("""
+                SELECT date, timestamp, preheat, main_heat, rib_heat
+                FROM readings
+                WHERE ts_epoch BETWEEN ? AND ?
+                ORDER BY ts_epoch
+            """, (self._to_epoch(start_time), self._to_epoch(end_time)))
             
             readings = []
-            for row in cursor.fetchall():
+            for row in cursor:
                 date_str, time_str, preheat, main_heat, rib_heat = row
                 
                 # Extract temperature for the specific device
@@ -98,7 +98,7 @@ class VulcanSentinelApp:
             
             # Initialize Modbus poller
             logger.info("Initializing Modbus poller...")
-            self.modbus_poller = ModbusPoller()
+            self.modbus_poller = ModbusPoller(config_manager=self.config_manager, db_manager=self.db_manager)
             
             # Initialize report generator
             logger.info("Initializing report generator...")
@@ -112,7 +112,8 @@ class VulcanSentinelApp:
                 config_manager=self.config_manager,
                 report_generator=self.report_generator,
                 host=api_config.get('host', '0.0.0.0'),
-                port=api_config.get('port', 8080)
+                port=api_config.get('port', 8080),
+                threads=api_config.get('threads', 8)
             )
             
             # Log initialization event
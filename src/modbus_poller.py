@@ -11,15 +11,14 @@ import logging
 from logging.handlers import RotatingFileHandler
 import threading
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import yaml
 import pytz
 import math
+import struct
 
 from pymodbus.client import ModbusTcpClient
-from pymodbus.payload import BinaryPayloadDecoder
-from pymodbus.constants import Endian
 from pymodbus.exceptions import ModbusException
 
 from .database import DatabaseManager
@@ -53,6 +52,19 @@ def setup_logging():
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Most input registers a single Modbus read request may return
+MAX_REGISTERS_PER_READ = 125
+
+# 32-bit floats arrive as two big-endian registers, low word first; swapping the
+# words back gives the big-endian IEEE 754 bytes
+WORDS_FMT = struct.Struct('>HH')
+FLOAT_FMT = struct.Struct('>f')
+
+
+def decode_float(registers: List[int]) -> float:
+    """Decode a 32-bit float from two registers (big-endian bytes, little-endian word order)"""
+    return FLOAT_FMT.unpack(WORDS_FMT.pack(registers[1], registers[0]))[0]
+
 
 @dataclass
 class ModbusDevice:
@@ -72,9 +84,11 @@ class ModbusDevice:
 class ModbusPoller:
     """Main Modbus polling service"""
     
-    def __init__(self, config_path: str = "config/"):
-        self.config_manager = ConfigManager(config_path)
-        self.db_manager = DatabaseManager()
+    def __init__(self, config_path: str = "config/", config_manager: Optional[ConfigManager] = None,
+                 db_manager: Optional[DatabaseManager] = None):
+        # Managers can be passed in to share them with the rest of the app (or to use mocks in tests)
+        self.config_manager = config_manager or ConfigManager(config_path)
+        self.db_manager = db_manager or DatabaseManager()
         self.devices: Dict[str, ModbusDevice] = {}
         self.running = False
         self.threads: List[threading.Thread] = []
@@ -147,44 +161,69 @@ class ModbusPoller:
             logger.error(f"Connection error for {device.name}: {e}")
             return False
     
-    def _read_register(self, device: ModbusDevice, register_name: str, register_address: int) -> Optional[float]:
-        """Read a single register from a device - using exact same method as working script"""
+    def _read_registers(self, device: ModbusDevice, registers: Dict[str, int]) -> Dict[str, float]:
+        """Read 32-bit float registers from a device, fetching each run of back-to-back values in one request"""
         # Check connection first
         if not device.client or not device.client.is_socket_open():
             if not self._connect_device(device):
-                return None
+                return {}
         
-        # Use exact same method as the working single sensor script - NO exception handling around decoder
-        result = device.client.read_input_registers(register_address, 2, slave=1)
-        if not result.isError():
-            try:
-                decoder = BinaryPayloadDecoder.fromRegisters(
-                    result.registers,
-                    byteorder=Endian.BIG,
-                    wordorder=Endian.LITTLE
-                )
-                
-                temp = decoder.decode_32bit_float()
-                
-                # Ensure we return a float value
-                if temp is not None:
-                    try:
-                        float_temp = float(temp)
-                        # Round to whole number
-                        rounded_temp = round(float_temp)
-                        logger.debug(f"Read {device.name} {register_name}: {rounded_temp}°F")
-                        return rounded_temp
-                    except (ValueError, TypeError) as e:
-                        logger.error(f"Failed to convert temperature to float: {temp}, error: {e}")
-                        return None
-                else:
-                    logger.warning(f"Decoded temperature is None for {device.name}")
+        readings = {}
+        for block in self._register_blocks(registers):
+            start = block[0][1]
+            count = block[-1][1] + 2 - start
+            result = device.client.read_input_registers(start, count, slave=1)
+            if result.isError():
+                for register_name, _ in block:
+                    logger.warning(f"Error reading register {register_name} from {device.name}")
+                continue
+            
+            # Each value spans two registers at its offset within the block
+            for register_name, register_address in block:
+                offset = register_address - start
+                value = self._decode_temperature(device, register_name, result.registers[offset:offset + 2])
+                if value is not None:
+                    readings[register_name] = value
+        
+        return readings
+    
+    @staticmethod
+    def _register_blocks(registers: Dict[str, int]) -> List[List[Tuple[str, int]]]:
+        """Group (name, address) pairs into runs of adjacent values that fit a single Modbus read
+        
+        Only values that directly follow the previous one (address + 2) share a block, so a
+        read never touches unmapped addresses in between, which many devices reject.
+        """
+        blocks = []
+        for register_name, register_address in sorted(registers.items(), key=lambda item: item[1]):
+            if (blocks and register_address <= blocks[-1][-1][1] + 2
+                    and register_address + 2 - blocks[-1][0][1] <= MAX_REGISTERS_PER_READ):
+                blocks[-1].append((register_name, register_address))
+            else:
+                blocks.append([(register_name, register_address)])
+        return blocks
+    
+    def _decode_temperature(self, device: ModbusDevice, register_name: str, registers: List[int]) -> Optional[float]:
+        """Decode a 32-bit float temperature from two registers - same decoding as the working script"""
+        try:
+            temp = decode_float(registers)
+            
+            # Ensure we return a float value
+            if temp is not None:
+                try:
+                    float_temp = float(temp)
+                    # Round to whole number
+                    rounded_temp = round(float_temp)
+                    logger.debug(f"Read {device.name} {register_name}: {rounded_temp}°F")
+                    return rounded_temp
+                except (ValueError, TypeError) as e:
+                    logger.error(f"Failed to convert temperature to float: {temp}, error: {e}")
                     return None
-            except Exception as e:
-                logger.error(f"Error in decoding for {device.name}: {e}")
+            else:
+                logger.warning(f"Decoded temperature is None for {device.name}")
                 return None
-        else:
-            logger.warning(f"Error reading register {register_name} from {device.name}")
+        except Exception as e:
+            logger.error(f"Error in decoding for {device.name}: {e}")
             return None
     
     def _read_setpoint_register(self, device: ModbusDevice, register_address: int) -> Optional[float]:
@@ -198,16 +237,9 @@ class ModbusPoller:
         result = device.client.read_input_registers(register_address, 2, slave=1)
         if not result.isError():
             try:
-                # Setpoint is stored as IEEE Float (32-bit) across 2 registers
-                # Use BinaryPayloadDecoder with correct byte order and word order
-                decoder = BinaryPayloadDecoder.fromRegisters(
-                    result.registers, 
-                    byteorder=Endian.BIG, 
-                    wordorder=Endian.LITTLE
-                )
-                
-                # Decode as 32-bit float
-                setpoint = decoder.decode_32bit_float()
+                # Setpoint is stored as IEEE Float (32-bit) across 2 registers,
+                # with the same byte and word order as the temperatures
+                setpoint = decode_float(result.registers)
                 
                 # Ensure we return a valid float value
                 if setpoint is not None and not math.isnan(setpoint) and not math.isinf(setpoint):
@@ -237,13 +269,8 @@ class ModbusPoller:
         while self.running:
             try:
                 timestamp = datetime.now(self.cst_tz)
-                readings = {}
-                
-                # Read all registers for this device
-                for register_name, register_address in device.registers.items():
-                    value = self._read_register(device, register_name, register_address)
-                    if value is not None:
-                        readings[register_name] = value
+                # Read all registers for this device, one request per run of adjacent registers
+                readings = self._read_registers(device, device.registers)
                 
                 # Store readings if we got any valid data
                 if readings:
@@ -24,7 +24,7 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 import io
 import hashlib
 import uuid
-import pytz
+from zoneinfo import ZoneInfo
 import csv
 
 logger = logging.getLogger(__name__)
@@ -40,9 +40,12 @@ class ReportGenerator:
         self.reports_dir = "/app/reports"
         self._ensure_reports_directory()
         self.report_counter = self._load_report_counter()
+        self._report_index = {}
+        self._report_list = []
+        self._report_index_stamp = None
         
         # Set timezone to CST to match other components
-        self.cst_tz = pytz.timezone('America/Chicago')
+        self.cst_tz = ZoneInfo('America/Chicago')
         
     def _ensure_reports_directory(self):
         """Ensure reports directory exists"""
@@ -291,7 +294,7 @@ class ReportGenerator:
                 # Convert database timestamp to timezone-aware datetime
                 event_time = datetime.fromisoformat(event['timestamp'])
                 # Make it timezone-aware by localizing to CST
-                event_time = self.cst_tz.localize(event_time)
+                event_time = event_time.replace(tzinfo=self.cst_tz)
                 
                 if start_time <= event_time <= end_time:
                     if 'trigger' in event['event_type'].lower() or 'stage' in event['event_type'].lower():
@@ -316,7 +319,7 @@ class ReportGenerator:
                 # Convert database timestamp to timezone-aware datetime
                 event_time = datetime.fromisoformat(event['timestamp'])
                 # Make it timezone-aware by localizing to CST
-                event_time = self.cst_tz.localize(event_time)
+                event_time = event_time.replace(tzinfo=self.cst_tz)
                 
                 if start_time <= event_time <= end_time:
                     if 'override' in event['event_type'].lower() or 'manual' in event['event_type'].lower():
@@ -930,47 +933,61 @@ class ReportGenerator:
             # Save updated metadata
             with open(metadata_file, 'w') as f:
                 json.dump(existing_metadata, f, indent=2)
+            
+            # Force the next lookup to re-read the file
+            self._report_index_stamp = None
                 
         except Exception as e:
             logger.error(f"Failed to save report metadata: {e}")
             
+    def _load_report_metadata(self):
+        """Reload report metadata only when the metadata file has changed since the last read"""
+        metadata_file = os.path.join(self.reports_dir, "report_metadata.json")
+        
+        if not os.path.exists(metadata_file):
+            self._report_index = {}
+            self._report_list = []
+            self._report_index_stamp = None
+            return
+            
+        # mtime alone can miss a rewrite within the filesystem's timestamp resolution
+        stat = os.stat(metadata_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._report_index_stamp:
+            with open(metadata_file, 'r') as f:
+                metadata_list = json.load(f)
+                
+            # Sort by generation time (newest first)
+            metadata_list.sort(key=lambda x: x.get('generated_at', ''), reverse=True)
+            self._report_list = metadata_list
+            self._report_index = {m.get('report_id'): m for m in metadata_list}
+            self._report_index_stamp = stamp
+            
     def get_report_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent report history"""
         try:
-            metadata_file = os.path.join(self.reports_dir, "report_metadata.json")
-            
-            if os.path.exists(metadata_file):
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    
-                # Sort by generation time (newest first)
-                metadata.sort(key=lambda x: x.get('generated_at', ''), reverse=True)
-                return metadata[:limit]
-            else:
-                return []
+            self._load_report_metadata()
+            return self._report_list[:limit]
                 
         except Exception as e:
             logger.error(f"Failed to get report history: {e}")
             return []
             
+    def get_report_by_id(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Get report metadata by report ID"""
+        try:
+            self._load_report_metadata()
+            return self._report_index.get(report_id)
+            
+        except Exception as e:
+            logger.error(f"Failed to get report {report_id}: {e}")
+            return None
+            
     def export_report_csv(self, report_id: str) -> str:
         """Export report data to CSV format matching database readings table structure"""
         try:
             # Get report metadata to find the original parameters
-            metadata_file = os.path.join(self.reports_dir, "report_metadata.json")
-            
-            if not os.path.exists(metadata_file):
-                raise Exception("Report metadata not found")
-                
-            with open(metadata_file, 'r') as f:
-                metadata_list = json.load(f)
-            
-            # Find the specific report
-            report_metadata = None
-            for metadata in metadata_list:
-                if metadata.get('report_id') == report_id:
-                    report_metadata = metadata
-                    break
+            report_metadata = self.get_report_by_id(report_id)
             
             if not report_metadata:
                 raise Exception(f"Report {report_id} not found in metadata")
@@ -989,54 +1006,40 @@ class ReportGenerator:
             csv_path = os.path.join(self.reports_dir, f"report_data_{report_id}.csv")
             
             # Connect to database and query the readings table directly
-            conn = sqlite3.connect(self.db_manager.db_path)
+            conn = sqlite3.connect(self.db_manager.db_path, uri=True)
             cursor = conn.cursor()
             
-            # Convert datetime objects to date and time strings for the new schema
-            start_date = start_time.strftime('%Y-%m-%d')
-            start_time_str = start_time.strftime('%H:%M:%S')
-            end_date = end_time.strftime('%Y-%m-%d')
-            end_time_str = end_time.strftime('%H:%M:%S')
-            
-            # Query based on the new schema with date and timestamp columns
-            if start_date == end_date:
-                # Same day query
-                cursor.execute("""
-                    SELECT date, timestamp, preheat, main_heat, rib_heat
-                    FROM readings
-                    WHERE date = ? AND timestamp BETWEEN ? AND ?
-                    ORDER BY date ASC, timestamp ASC
-                """, (start_date, start_time_str, end_time_str))
-            else:
-                # Cross-day query
-                cursor.execute("""
-                    SELECT date, timestamp, preheat, main_heat, rib_heat
-                    FROM readings
-                    WHERE (date > ? OR (date = ? AND timestamp >= ?))
-                    AND (date < ? OR (date = ? AND timestamp <= ?))
-                    ORDER BY date ASC, timestamp ASC
-                """, (start_date, start_date, start_time_str, end_date, end_date, end_time_str))
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            with open(csv_path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                # Write header matching the database readings table structure
-                writer.writerow(['date', 'timestamp', 'preheat', 'main_heat', 'rib_heat'])
-                
-                # Write data rows
-                for row in rows:
-                    date_str, time_str, preheat, main_heat, rib_heat = row
-                    writer.writerow([
-                        date_str,
-                        time_str,
-                        preheat if preheat is not None else '',
-                        main_heat if main_heat is not None else '',
-                        rib_heat if rib_heat is not None else ''
-                    ])
+            # Same ts_epoch range as get_readings_range, so the export covers exactly
+            # the rows in the report (DST fall-back hour included)
+            cursor.execute("""
+                SELECT date, timestamp, preheat, main_heat, rib_heat
+                FROM readings
+                WHERE ts_epoch BETWEEN ? AND ?
+                ORDER BY ts_epoch ASC
+            """, (self.db_manager._to_epoch(start_time), self.db_manager._to_epoch(end_time)))
+            
+            row_count = 0
+            try:
+                with open(csv_path, 'w', newline='') as f:
+                    writer = csv.writer(f)
+                    # Write header matching the database readings table structure
+                    writer.writerow(['date', 'timestamp', 'preheat', 'main_heat', 'rib_heat'])
+                    
+                    # Write data rows straight from the cursor instead of materializing them first
+                    for row in cursor:
+                        date_str, time_str, preheat, main_heat, rib_heat = row
+                        writer.writerow([
+                            date_str,
+                            time_str,
+                            preheat if preheat is not None else '',
+                            main_heat if main_heat is not None else '',
+                            rib_heat if rib_heat is not None else ''
+                        ])
+                        row_count += 1
+            finally:
+                conn.close()
                 
-            logger.info(f"CSV exported to {csv_path} with {len(rows)} rows")
+            logger.info(f"CSV exported to {csv_path} with {row_count} rows")
             return csv_path
             
         except Exception as e:
@@ -93,10 +93,12 @@ document.addEventListener('DOMContentLoaded', function() {
     });
 
     // Load initial data
+    updateCurrentReadings();
     updateChartData();
     updateStorageInfo();
 
     // Set up auto-refresh intervals with longer intervals to reduce server load
+    setInterval(updateCurrentReadings, 20000); // Every 20 seconds, the default polling interval
     setInterval(updateChartData, 60000); // Every 60 seconds (reduced from 30)
     setInterval(updateStorageInfo, 300000); // Every 5 minutes (reduced from 2 minutes)
 
@@ -106,52 +108,82 @@ document.addEventListener('DOMContentLoaded', function() {
     }, 600000);
 });
 
+// Format a device key like 'main_heat' as 'Main Heat'
+function formatDeviceName(deviceName) {
+    return deviceName.split('_').map(word => word.charAt(0).toUpperCase() + word.slice(1)).join(' ');
+}
+
+// Function to update the current temperature and device status cards
+async function updateCurrentReadings() {
+    try {
+        const [readingsResponse, statusResponse] = await Promise.all([
+            fetch('/api/readings'),
+            fetch('/api/status')
+        ]);
+        const readings = await readingsResponse.json();
+        const status = await statusResponse.json();
+        
+        // Current temperatures
+        document.getElementById('current-temperatures').innerHTML = Object.entries(readings).map(([deviceName, data]) => {
+            let value;
+            if (data.connected || data.temperature !== 'N/A') {
+                value = `<div class="temperature">${data.temperature}°F</div>`;
+            } else {
+                value = '<div style="text-align: center; color: #dc3545; font-size: 1.2em;">N/A</div>';
+            }
+            const footer = data.connected ? `Last updated: ${data.timestamp}` : '⚠️ Disconnected';
+            return `
+                <div style="margin: 15px 0; padding: 15px; background: #f8f9fa; border-radius: 8px;">
+                    <div style="font-weight: bold; color: #333;">${formatDeviceName(deviceName)}</div>
+                    ${value}
+                    <div style="text-align: center; color: #007bff; font-size: 0.9em; margin-top: 5px;">
+                        Setpoint: ${data.setpoint}°F
+                    </div>
+                    <div style="text-align: center; color: #666; font-size: 0.9em; margin-top: 5px;">${footer}</div>
+                </div>
+            `;
+        }).join('');
+        
+        // Device connection status
+        document.getElementById('device-status').innerHTML = Object.entries(status.devices || {}).map(([deviceName, data]) => `
+            <div class="device-info">
+                <span>${formatDeviceName(deviceName)}:</span>
+                <span class="${data.connected ? 'connected' : 'disconnected'}">${data.connected ? '🟢 Connected' : '🔴 Disconnected'}</span>
+            </div>
+        `).join('');
+        
+        // Server time of the status snapshot, shown as plant-local 'YYYY-MM-DD HH:MM:SS'
+        if (status.timestamp) {
+            document.getElementById('last-update').textContent = status.timestamp.slice(0, 19).replace('T', ' ');
+        }
+        
+    } catch (error) {
+        console.error('Error updating current readings:', error);
+    }
+}
+
 // Function to update chart data
 async function updateChartData() {
     try {
         const response = await fetch('/api/readings/history?days=1');
         const data = await response.json();
         
-        // Clear existing data
+        // Clear existing labels
         temperatureChart.data.labels = [];
-        temperatureChart.data.datasets.forEach(dataset => {
-            dataset.data = [];
-        });
         
-        // Process data for each device
-        const deviceData = {
-            preheat: [],
-            main_heat: [],
-            rib_heat: []  // Include rib_heat for chart display
-        };
-        
-        // Collect data points
-        Object.keys(data).forEach(deviceName => {
-            if (data[deviceName] && Array.isArray(data[deviceName])) {
-                data[deviceName].forEach(reading => {
-                    const timestamp = new Date(reading.timestamp);
-                    const temp = reading.temperature;
-                    
-                    if (deviceName === 'preheat') {
-                        deviceData.preheat.push({x: timestamp, y: temp});
-                    } else if (deviceName === 'main_heat') {
-                        deviceData.main_heat.push({x: timestamp, y: temp});
-                    } else if (deviceName === 'rib_heat') {
-                        deviceData.rib_heat.push({x: timestamp, y: temp});
-                    }
-                });
+        // Each device comes back as parallel, time-ordered arrays:
+        // {temperature: [...], timestamp: [...]}
+        const toPoints = series => {
+            if (!series || !Array.isArray(series.timestamp)) {
+                return [];
             }
-        });
-        
-        // Sort data by timestamp
-        Object.keys(deviceData).forEach(device => {
-            deviceData[device].sort((a, b) => a.x - b.x);
-        });
+            return series.timestamp.map((timestamp, i) => ({x: new Date(timestamp), y: series.temperature[i]}));
+        };
         
         // Update chart datasets
-        temperatureChart.data.datasets[0].data = deviceData.preheat;
-        temperatureChart.data.datasets[1].data = deviceData.main_heat;
-        temperatureChart.data.datasets[2].data = deviceData.rib_heat;
+        temperatureChart.data.datasets[0].data = toPoints(data.preheat);
+        temperatureChart.data.datasets[1].data = toPoints(data.main_heat);
+        temperatureChart.data.datasets[2].data = toPoints(data.rib_heat);  // Include rib_heat for chart display
         
         temperatureChart.update();
         
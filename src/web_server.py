@@ -12,53 +12,158 @@ Provides a web interface for viewing:
 import os
 import json
 import logging
-from datetime import datetime, timedelta
-from flask import Flask, render_template, jsonify, send_file, request
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from flask import Flask, Response, render_template, jsonify, send_file, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
+import orjson
+from waitress import serve
 import sqlite3
-import csv
-from io import StringIO, BytesIO
-import pytz
 import shutil
 import psutil
 import time
-from functools import wraps
+import hashlib
+import threading
+import queue
+import itertools
+import zlib
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
-# Simple cache for API responses
-_api_cache = {}
-_cache_timeout = 30  # seconds
-
-def cache_response(timeout=30):
-    """Decorator to cache API responses"""
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            cache_key = f.__name__ + str(args) + str(sorted(kwargs.items()))
-            current_time = time.time()
-            
-            # Check if we have a cached response that's still valid
-            if cache_key in _api_cache:
-                cached_time, cached_response = _api_cache[cache_key]
-                if current_time - cached_time < timeout:
-                    return cached_response
-            
-            # Get fresh response and cache it
-            response = f(*args, **kwargs)
-            _api_cache[cache_key] = (current_time, response)
-            return response
-        return decorated_function
-    return decorator
+# Sensor columns in the readings table
+SENSOR_COLUMNS = ['preheat', 'main_heat', 'rib_heat']
+
+# Rows pulled per fetchmany() call when walking larger result sets
+FETCH_BATCH_SIZE = 4096
+
+# Longest history window the API serves, and the bucket widths it accepts; client
+# values are clamped onto these so the history cache only ever holds a few keys
+MAX_HISTORY_DAYS = 30
+HISTORY_BUCKET_SECONDS = (1, 20, 60, 300, 900, 3600)
+
+# Hot queries live at module level so every call reuses the same statement text
+# and hits the connection's prepared-statement cache
+
+# Newest non-null reading of each sensor and whether it was taken at or after the
+# :cutoff epoch; each branch is answered by that sensor's partial index
+_SQL_LATEST_READINGS = """
+    SELECT 'preheat', date, timestamp, preheat, ts_epoch >= :cutoff FROM (
+        SELECT date, timestamp, preheat, ts_epoch FROM readings
+        WHERE preheat IS NOT NULL
+        ORDER BY date DESC, timestamp DESC LIMIT 1
+    )
+    UNION ALL
+    SELECT 'main_heat', date, timestamp, main_heat, ts_epoch >= :cutoff FROM (
+        SELECT date, timestamp, main_heat, ts_epoch FROM readings
+        WHERE main_heat IS NOT NULL
+        ORDER BY date DESC, timestamp DESC LIMIT 1
+    )
+    UNION ALL
+    SELECT 'rib_heat', date, timestamp, rib_heat, ts_epoch >= :cutoff FROM (
+        SELECT date, timestamp, rib_heat, ts_epoch FROM readings
+        WHERE rib_heat IS NOT NULL
+        ORDER BY date DESC, timestamp DESC LIMIT 1
+    )
+"""
+
+# Per-bucket sensor averages since the :start epoch, labelled with the CST bucket start time
+_SQL_HISTORY_BUCKETS = """
+    SELECT datetime(bucket * :bucket, 'unixepoch'),
+           ROUND(AVG(preheat), 1),
+           ROUND(AVG(main_heat), 1),
+           ROUND(AVG(rib_heat), 1)
+    FROM (
+        SELECT CAST(strftime('%s', date || ' ' || timestamp) AS INTEGER) / :bucket AS bucket,
+               preheat, main_heat, rib_heat
+        FROM readings
+        WHERE ts_epoch >= :start
+    )
+    GROUP BY bucket
+    ORDER BY bucket
+"""
+
+# Record count, oldest/newest record and count since a given epoch; every
+# subquery is answered from an index
+_SQL_STORAGE_STATS = """
+    SELECT (SELECT COUNT(*) FROM readings),
+           (SELECT date || ' ' || timestamp FROM readings
+            ORDER BY date, timestamp LIMIT 1),
+           (SELECT date || ' ' || timestamp FROM readings
+            ORDER BY date DESC, timestamp DESC LIMIT 1),
+           (SELECT COUNT(*) FROM readings WHERE ts_epoch >= ?)
+"""
+
+# Per-sensor reading count, first/last reading time and temperature statistics
+_SQL_DEVICE_STATS = """
+    SELECT 'preheat', COUNT(*), MIN(date || ' ' || timestamp), MAX(date || ' ' || timestamp),
+           ROUND(AVG(preheat), 1), MIN(preheat), MAX(preheat)
+    FROM readings WHERE preheat IS NOT NULL
+    UNION ALL
+    SELECT 'main_heat', COUNT(*), MIN(date || ' ' || timestamp), MAX(date || ' ' || timestamp),
+           ROUND(AVG(main_heat), 1), MIN(main_heat), MAX(main_heat)
+    FROM readings WHERE main_heat IS NOT NULL
+    UNION ALL
+    SELECT 'rib_heat', COUNT(*), MIN(date || ' ' || timestamp), MAX(date || ' ' || timestamp),
+           ROUND(AVG(rib_heat), 1), MIN(rib_heat), MAX(rib_heat)
+    FROM readings WHERE rib_heat IS NOT NULL
+"""
+
+# Every row with at least one sensor value, newest first
+_SQL_CSV_EXPORT = """
+    SELECT date, timestamp, preheat, main_heat, rib_heat
+    FROM readings
+    WHERE preheat IS NOT NULL OR main_heat IS NOT NULL OR rib_heat IS NOT NULL
+    ORDER BY date DESC, timestamp DESC
+"""
+
+# Up to ? readings that repeat an earlier row's date and timestamp, keeping the lowest id
+_SQL_DELETE_DUPLICATES = """
+    WITH dups AS (
+        SELECT id, ROW_NUMBER() OVER (PARTITION BY date, timestamp ORDER BY id) AS rn
+        FROM readings
+    )
+    DELETE FROM readings
+    WHERE id IN (SELECT id FROM dups WHERE rn > 1 LIMIT ?)
+"""
+
+# orjson options shared by the JSON provider and the raw-bytes responses
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify() and request.get_json()"""
+    
+    def dumps(self, obj, **kwargs):
+        # Types orjson doesn't know natively fall back to Flask's default handling
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode('utf-8')
+    
+    def dumps_bytes(self, obj):
+        """Serialize straight to UTF-8 bytes, skipping the decode/encode round-trip"""
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS)
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def _gzip_chunks(chunks, level):
+    """Compress an iterable of byte chunks into a single gzip stream"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
 
 class VulcanSentinelWebServer:
     """Flask web server for Vulcan Sentinel"""
     
     def __init__(self, db_path="data/vulcan_sentinel.db", host="0.0.0.0", port=8080, 
-                 db_manager=None, config_manager=None, report_generator=None):
+                 db_manager=None, config_manager=None, report_generator=None, threads=8):
         self.db_path = db_path
         self.host = host
         self.port = port
+        self.threads = threads
         self.db_manager = db_manager
         self.config_manager = config_manager
         self.report_generator = report_generator
@@ -66,22 +171,177 @@ class VulcanSentinelWebServer:
         # Initialize Flask app with template folder
         template_dir = os.path.join(os.path.dirname(__file__), 'templates')
         static_dir = os.path.join(os.path.dirname(__file__), 'static')
+        # Behind nginx /static/ never reaches Flask, but the route stays as the
+        # fallback for clients hitting the app port directly
         self.app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
+        self._static_versions = {}
+        self.app.url_defaults(self._add_static_version)
+        self.app.json = OrjsonProvider(self.app)
         CORS(self.app)
         
+        # Compress JSON, CSV exports and the dashboard page; level 4 keeps CPU cost low,
+        # and small status/health payloads aren't worth a compression pass
+        self.app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/csv', 'text/html']
+        self.app.config['COMPRESS_LEVEL'] = 4
+        self.app.config['COMPRESS_MIN_SIZE'] = 1024
+        Compress(self.app)
+        
+        # The dashboard page is a static shell filled in by dashboard.js from the JSON
+        # endpoints, so it is rendered once on first request and reused
+        self._dashboard_html = None
+        
         # Set timezone to CST
-        self.cst_tz = pytz.timezone('America/Chicago')
+        self.cst_tz = ZoneInfo('America/Chicago')
+
+        # Idle database connections, reused across requests
+        self._conn_pool = queue.Queue(maxsize=threads + 2)
         
+        # Short-lived cache of query results, keyed by name: key -> (expires_at, value)
+        self._data_cache = {}
+        self._data_cache_locks = {}
+        self._data_cache_guard = threading.Lock()
+
+        # Last health check result as (epoch second, JSON body, status code)
+        self._health_cache = (None, b'', 200)
+
+        # Make sure the indexes used by the dashboard queries exist
+        self._prepare_database()
+
         # Register routes
         self._register_routes()
     
+    def _add_static_version(self, endpoint, values):
+        """Append a content hash to url_for('static', ...) so long-cached assets bust on change"""
+        if endpoint != 'static' or 'filename' not in values:
+            return
+        
+        filename = values['filename']
+        try:
+            stat = os.stat(os.path.join(self.app.static_folder, filename))
+        except OSError:
+            return
+        
+        key = (filename, stat.st_mtime_ns, stat.st_size)
+        version = self._static_versions.get(key)
+        if version is None:
+            with open(os.path.join(self.app.static_folder, filename), 'rb') as f:
+                version = hashlib.md5(f.read()).hexdigest()[:12]
+            self._static_versions[key] = version
+        values['v'] = version
+    
+    def _open_connection(self):
+        """Open a database connection tuned for the read-heavy web endpoints"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=128)
+        
+        # Writes are already durable through the WAL; skip the extra fsyncs
+        conn.execute("PRAGMA synchronous=NORMAL")
+        
+        # Keep temp b-trees in memory and serve hot pages from the page cache / mmap
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled database connection, opening a new one when none is idle"""
+        try:
+            conn = self._conn_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
+        
+        try:
+            yield conn
+        finally:
+            try:
+                self._conn_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
+    def _cached(self, key, ttl, fn):
+        """Return fn() from the data cache, recomputing it at most once per ttl seconds"""
+        entry = self._data_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        
+        with self._data_cache_guard:
+            key_lock = self._data_cache_locks.setdefault(key, threading.Lock())
+        
+        # Concurrent misses on the same key wait for a single query
+        with key_lock:
+            entry = self._data_cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            
+            value = fn()
+            now = time.monotonic()
+            self._data_cache[key] = (now + ttl, value)
+        
+        # Drop other expired entries and their locks so the cache can't grow without bound
+        with self._data_cache_guard:
+            for stale_key, (expires_at, _) in list(self._data_cache.items()):
+                if expires_at <= now and stale_key != key:
+                    self._data_cache.pop(stale_key, None)
+                    self._data_cache_locks.pop(stale_key, None)
+        return value
+    
+    def _prepare_database(self):
+        """Enable WAL mode and create indexes for the latest-reading lookups"""
+        try:
+            conn = self._open_connection()
+            cursor = conn.cursor()
+
+            # WAL is persistent in the database file; readers no longer block on the poller's writes
+            cursor.execute("PRAGMA journal_mode=WAL")
+
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            existing_indexes = {row[0] for row in cursor}
+
+            # Same definition as DatabaseManager.create_tables; duplicate cleanup partitions on it
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_readings_date_timestamp
+                ON readings (date, timestamp)
+            """)
+
+            # One partial covering index per sensor, so the newest non-null
+            # reading of a sensor is a single index seek instead of a table scan
+            created = False
+            for sensor in SENSOR_COLUMNS:
+                index_name = f"idx_readings_{sensor}_latest"
+                if index_name not in existing_indexes:
+                    cursor.execute(f"""
+                        CREATE INDEX IF NOT EXISTS {index_name}
+                        ON readings (date, timestamp, {sensor})
+                        WHERE {sensor} IS NOT NULL
+                    """)
+                    created = True
+
+            # Refresh planner statistics so the new indexes get used
+            if created:
+                cursor.execute("ANALYZE")
+            cursor.execute("PRAGMA optimize")
+
+            conn.commit()
+            conn.close()
+
+        except Exception as e:
+            logger.warning(f"Could not prepare database indexes: {e}")
+
     def _register_routes(self):
         """Register all web routes"""
         
         @self.app.route('/')
         def index():
             """Main dashboard page"""
-            return self._get_dashboard()
+            response = self.app.response_class(self._get_dashboard(), mimetype='text/html')
+            # Only the rendered shell is browser-cacheable, never an error page
+            if self._dashboard_html is not None:
+                response.cache_control.public = True
+                response.cache_control.max_age = 3600
+            return response
         
         @self.app.route('/reports')
         def reports():
@@ -91,26 +351,42 @@ class VulcanSentinelWebServer:
         @self.app.route('/api/status')
         def api_status():
             """Get system status"""
-            return jsonify(self._get_system_status())
+            # The generated-at timestamp changes on every refresh; validate on the device state only
+            return self._conditional_json(self._cached('status', 2, lambda: self._encode_with_etag(
+                self._get_system_status(), lambda status: {k: v for k, v in status.items() if k != 'timestamp'}
+            )))
         
         @self.app.route('/api/readings')
-        @cache_response(timeout=15)  # Cache for 15 seconds
         def api_readings():
             """Get latest readings"""
-            return jsonify(self._get_latest_readings())
+            return self._conditional_json(self._cached(
+                'readings', 2, lambda: self._encode_with_etag(self._get_latest_readings())
+            ))
         
         @self.app.route('/api/readings/history')
-        @cache_response(timeout=60)  # Cache for 1 minute
         def api_history():
             """Get historical data"""
-            days = request.args.get('days', 1, type=int)
-            return jsonify(self._get_historical_data(days))
+            days = min(max(request.args.get('days', 1, type=int), 1), MAX_HISTORY_DAYS)
+            # bucket_seconds overrides the default resolution; raw=1 returns every stored reading
+            if request.args.get('raw', 0, type=int):
+                bucket_seconds = 1
+            else:
+                bucket_seconds = request.args.get('bucket_seconds', self._history_bucket_seconds(days), type=int)
+            # Round up to the nearest allowed width
+            bucket_seconds = next((b for b in HISTORY_BUCKET_SECONDS if b >= bucket_seconds),
+                                  HISTORY_BUCKET_SECONDS[-1])
+            # Cached per window size and resolution for 1 minute, already serialized and tagged
+            history = self._cached(
+                f'history:{days}:{bucket_seconds}', 60,
+                lambda: self._encode_with_etag(self._get_historical_data(days, bucket_seconds))
+            )
+            return self._conditional_json(history, max_age=60)
         
         @self.app.route('/api/devices')
-        @cache_response(timeout=300)  # Cache for 5 minutes
         def api_devices():
             """Get device information"""
-            return jsonify(self._get_device_info())
+            # Cached for 5 minutes
+            return self._json_response(self._cached('devices', 300, self._get_device_info))
         
         @self.app.route('/api/csv/<device_name>')
         def api_csv(device_name):
@@ -120,38 +396,16 @@ class VulcanSentinelWebServer:
         @self.app.route('/health')
         def health():
             """Health check endpoint"""
-            try:
-                # Check if we can access the database
-                db_status = "healthy"
-                try:
-                    # Simple database connectivity check
-                    self.db_manager.get_latest_readings()
-                except Exception as e:
-                    db_status = f"database_error: {str(e)}"
-                
-                # Check if we have any recent data (within last 5 minutes)
-                data_status = "healthy"
-                try:
-                    latest = self.db_manager.get_latest_readings()
-                    if not latest:
-                        data_status = "no_recent_data"
-                except Exception as e:
-                    data_status = f"data_error: {str(e)}"
-                
-                overall_status = "healthy" if db_status == "healthy" and data_status == "healthy" else "degraded"
-                
-                return jsonify({
-                    "status": overall_status,
-                    "database": db_status,
-                    "data": data_status,
-                    "timestamp": datetime.now(self.cst_tz).isoformat()
-                })
-            except Exception as e:
-                return jsonify({
-                    "status": "unhealthy",
-                    "error": str(e),
-                    "timestamp": datetime.now(self.cst_tz).isoformat()
-                }), 500
+            # Monitors probe this every few seconds, so the serialized result
+            # is reused for the rest of the current second
+            current_second = int(time.time())
+            cached_second, body, status_code = self._health_cache
+            if cached_second != current_second:
+                payload, status_code = self._get_health()
+                body = self.app.json.dumps_bytes(payload)
+                self._health_cache = (current_second, body, status_code)
+
+            return self.app.response_class(body, status=status_code, mimetype='application/json')
         
         @self.app.route('/api/cleanup-duplicates')
         def api_cleanup_duplicates():
@@ -161,7 +415,7 @@ class VulcanSentinelWebServer:
         @self.app.route('/api/storage-info')
         def api_storage_info():
             """Get storage usage information"""
-            return jsonify(self._get_storage_info())
+            return self._json_response(self._cached('storage_info', 30, self._get_storage_info))
         
         # Report generation endpoints
         @self.app.route('/api/reports/generate', methods=['POST'])
@@ -173,7 +427,7 @@ class VulcanSentinelWebServer:
         def api_report_history():
             """Get report history"""
             limit = request.args.get('limit', 50, type=int)
-            return jsonify(self._get_report_history(limit))
+            return self._json_response(self._get_report_history(limit))
         
         @self.app.route('/api/reports/download/<report_id>')
         def api_download_report(report_id):
@@ -187,178 +441,129 @@ class VulcanSentinelWebServer:
             """Export report data to CSV"""
             return self._export_report_csv(report_id)
     
+    def _json_response(self, data):
+        """JSON response built from orjson bytes for the hot endpoints"""
+        return self.app.response_class(self.app.json.dumps_bytes(data), mimetype='application/json')
+    
+    def _encode_with_etag(self, data, etag_source=None):
+        """Serialize data to JSON bytes and return (body, etag), ready to be cached together
+
+        The ETag hashes etag_source(data) when given, otherwise the serialized body.
+        """
+        body = self.app.json.dumps_bytes(data)
+        if etag_source is None:
+            tagged = body
+        else:
+            tagged = orjson.dumps(etag_source(data), option=orjson.OPT_SORT_KEYS)
+        return body, hashlib.sha1(tagged).hexdigest()
+    
+    def _conditional_json(self, encoded, max_age=2):
+        """JSON response for an encoded (body, etag) pair, answered with 304 when the client's copy matches
+
+        max_age should match the server-side cache TTL of the payload.
+        """
+        body, etag = encoded
+        # Revalidations are answered from the stored ETag without touching the body. flask-compress
+        # tags compressed responses as "<etag>:<encoding>", so match on the part before the colon
+        # and echo the client's tag back
+        matched = next((tag for tag in request.if_none_match.as_set(include_weak=True)
+                        if tag.partition(':')[0] == etag), None)
+        if matched is None and request.if_none_match.star_tag:
+            matched = etag
+        if matched is not None:
+            response = self.app.response_class(status=304)
+            response.set_etag(matched)
+        else:
+            response = self.app.response_class(body, mimetype='application/json')
+            response.set_etag(etag)
+        response.cache_control.max_age = max_age
+        response.cache_control.must_revalidate = True
+        return response
+    
     def _get_dashboard(self):
         """Generate dashboard HTML using Flask templates"""
         try:
-            # Get latest data
-            readings = self._get_latest_readings()
-            status = self._get_system_status()
-            setpoints = self.db_manager.get_all_setpoints()
-            
-            # Ensure readings is a dictionary
-            if not isinstance(readings, dict):
-                readings = {}
-            
-            # Ensure status has devices
-            if not isinstance(status, dict) or 'devices' not in status:
-                status = {'devices': {}}
-            
-            # Render template with data
-            return render_template('dashboard.html', 
-                                 readings=readings, 
-                                 status=status,
-                                 current_time=datetime.now(self.cst_tz).strftime('%Y-%m-%d %H:%M:%S'),
-                                 format_timestamp_cst=self._format_timestamp_cst)
+            if self._dashboard_html is None:
+                self._dashboard_html = render_template('dashboard.html')
+            return self._dashboard_html
             
         except Exception as e:
             logger.error(f"Error generating dashboard: {e}")
             return f"<h1>Error</h1><p>{str(e)}</p>"
-    
-    def _format_timestamp_cst(self, timestamp_str):
-        """Format timestamp to CST timezone with military time"""
+
+    def _get_health(self):
+        """Check database access and data freshness, returning (payload, status code)"""
         try:
-            if timestamp_str == 'N/A' or timestamp_str is None:
-                return 'N/A'
-            
-            # Handle different timestamp formats
-            if isinstance(timestamp_str, str):
-                # Try to parse as ISO format first
-                try:
-                    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                except ValueError:
-                    # If that fails, try parsing as naive datetime and localize
-                    dt = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                    dt = self.cst_tz.localize(dt)
-            else:
-                # If it's already a datetime object, use it directly
-                dt = timestamp_str
-            
-            # Ensure it's timezone-aware
-            if dt.tzinfo is None:
-                dt = self.cst_tz.localize(dt)
-            
-            # Convert to CST if it's not already
-            if dt.tzinfo != self.cst_tz:
-                cst_dt = dt.astimezone(self.cst_tz)
-            else:
-                cst_dt = dt
-            
-            # Format in military time
-            return cst_dt.strftime('%Y-%m-%d %H:%M:%S')
+            # A single lookup covers both database connectivity and recent data
+            db_status = "healthy"
+            data_status = "healthy"
+            try:
+                latest = self.db_manager.get_latest_readings()
+                if not latest:
+                    data_status = "no_recent_data"
+            except Exception as e:
+                db_status = f"database_error: {str(e)}"
+                data_status = f"data_error: {str(e)}"
+
+            overall_status = "healthy" if db_status == "healthy" and data_status == "healthy" else "degraded"
+
+            return {
+                "status": overall_status,
+                "database": db_status,
+                "data": data_status,
+                "timestamp": datetime.now(self.cst_tz)
+            }, 200
         except Exception as e:
-            logger.error(f"Error formatting timestamp {timestamp_str}: {e}")
-            return str(timestamp_str) if timestamp_str else 'N/A'
+            return {
+                "status": "unhealthy",
+                "error": str(e),
+                "timestamp": datetime.now(self.cst_tz)
+            }, 500
+
+    def _get_latest_sensor_rows(self):
+        """Newest reading of each sensor as {sensor: (date, time, value, connected)}, shared by readings and status"""
+        def query():
+            with self._conn() as conn:
+                # Get the most recent non-null reading of each sensor in one query,
+                # along with whether it is recent (within last 5 minutes)
+                cursor = conn.execute(_SQL_LATEST_READINGS, {'cutoff': int(time.time()) - 300})
+                return {row[0]: tuple(row[1:]) for row in cursor}
+        
+        return self._cached('latest_rows', 2, query)
     
     def _get_latest_readings(self):
         """Get latest temperature readings from new schema - optimized to reduce queries"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             # Get setpoints for all devices once
             setpoints = self.db_manager.get_all_setpoints()
             
-            # Get the most recent reading for each sensor type in one query
-            cursor.execute("""
-                SELECT 
-                    date, timestamp, preheat, main_heat, rib_heat,
-                    (SELECT date FROM readings WHERE preheat IS NOT NULL ORDER BY date DESC, timestamp DESC LIMIT 1) as preheat_date,
-                    (SELECT timestamp FROM readings WHERE preheat IS NOT NULL ORDER BY date DESC, timestamp DESC LIMIT 1) as preheat_time,
-                    (SELECT preheat FROM readings WHERE preheat IS NOT NULL ORDER BY date DESC, timestamp DESC LIMIT 1) as preheat_latest,
-                    (SELECT date FROM readings WHERE main_heat IS NOT NULL ORDER BY date DESC, timestamp DESC LIMIT 1) as main_heat_date,
-                    (SELECT timestamp FROM readings WHERE main_heat IS NOT NULL ORDER BY date DESC, timestamp DESC LIMIT 1) as main_heat_time,
-                    (SELECT main_heat FROM readings WHERE main_heat IS NOT NULL ORDER BY date DESC, timestamp DESC LIMIT 1) as main_heat_latest
-                FROM readings 
-                ORDER BY date DESC, timestamp DESC 
-                LIMIT 1
-            """)
+            latest = self._get_latest_sensor_rows()
             
-            row = cursor.fetchone()
-            if not row:
-                conn.close()
+            if not latest:
                 return {}
             
-            date_str, time_str, preheat, main_heat, rib_heat, p_date, p_time, p_temp, m_date, m_time, m_temp = row
-            
-            # Check if reading is recent (within last 5 minutes)
-            current_time = datetime.now(self.cst_tz)
-            reading_time = datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M:%S')
-            reading_time = self.cst_tz.localize(reading_time)
-            
-            time_diff = current_time - reading_time
-            connected = time_diff < timedelta(minutes=5)
-            
             readings = {}
             
-            # Process preheat data
-            if preheat is not None:
-                readings['preheat'] = {
-                    'temperature': preheat,
-                    'timestamp': f"{date_str} {time_str}",
-                    'connected': connected,
-                    'setpoint': setpoints.get('preheat', {}).get('setpoint_value', 'N/A')
-                }
-            elif p_temp is not None:
-                p_reading_time = datetime.strptime(f"{p_date} {p_time}", '%Y-%m-%d %H:%M:%S')
-                p_reading_time = self.cst_tz.localize(p_reading_time)
-                p_connected = (current_time - p_reading_time) < timedelta(minutes=5)
-                readings['preheat'] = {
-                    'temperature': p_temp,
-                    'timestamp': f"{p_date} {p_time}",
-                    'connected': p_connected,
-                    'setpoint': setpoints.get('preheat', {}).get('setpoint_value', 'N/A')
-                }
-            else:
-                readings['preheat'] = {
-                    'temperature': 'N/A',
-                    'timestamp': 'N/A',
-                    'connected': False,
-                    'setpoint': setpoints.get('preheat', {}).get('setpoint_value', 'N/A')
-                }
-            
-            # Process main_heat data
-            if main_heat is not None:
-                readings['main_heat'] = {
-                    'temperature': main_heat,
-                    'timestamp': f"{date_str} {time_str}",
-                    'connected': connected,
-                    'setpoint': setpoints.get('main_heat', {}).get('setpoint_value', 'N/A')
-                }
-            elif m_temp is not None:
-                m_reading_time = datetime.strptime(f"{m_date} {m_time}", '%Y-%m-%d %H:%M:%S')
-                m_reading_time = self.cst_tz.localize(m_reading_time)
-                m_connected = (current_time - m_reading_time) < timedelta(minutes=5)
-                readings['main_heat'] = {
-                    'temperature': m_temp,
-                    'timestamp': f"{m_date} {m_time}",
-                    'connected': m_connected,
-                    'setpoint': setpoints.get('main_heat', {}).get('setpoint_value', 'N/A')
-                }
-            else:
-                readings['main_heat'] = {
-                    'temperature': 'N/A',
-                    'timestamp': 'N/A',
-                    'connected': False,
-                    'setpoint': setpoints.get('main_heat', {}).get('setpoint_value', 'N/A')
-                }
-            
-            # Process rib_heat data
-            if rib_heat is not None:
-                readings['rib_heat'] = {
-                    'temperature': rib_heat,
-                    'timestamp': f"{date_str} {time_str}",
-                    'connected': connected,
-                    'setpoint': setpoints.get('rib_heat', {}).get('setpoint_value', 'N/A')
-                }
-            else:
-                readings['rib_heat'] = {
-                    'temperature': 'N/A',
-                    'timestamp': 'N/A',
-                    'connected': False,
-                    'setpoint': setpoints.get('rib_heat', {}).get('setpoint_value', 'N/A')
-                }
+            for sensor in SENSOR_COLUMNS:
+                setpoint = setpoints.get(sensor, {}).get('setpoint_value', 'N/A')
+                
+                if sensor in latest:
+                    date_str, time_str, temperature, connected = latest[sensor]
+                    
+                    readings[sensor] = {
+                        'temperature': temperature,
+                        'timestamp': f"{date_str} {time_str}",
+                        'connected': bool(connected),
+                        'setpoint': setpoint
+                    }
+                else:
+                    readings[sensor] = {
+                        'temperature': 'N/A',
+                        'timestamp': 'N/A',
+                        'connected': False,
+                        'setpoint': setpoint
+                    }
             
-            conn.close()
             return readings
             
         except Exception as e:
@@ -368,128 +573,30 @@ class VulcanSentinelWebServer:
     def _get_system_status(self):
         """Get system status from new database schema"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get the most recent reading time
-            cursor.execute("""
-                SELECT date, timestamp FROM readings 
-                ORDER BY date DESC, timestamp DESC 
-                LIMIT 1
-            """)
-            
-            row = cursor.fetchone()
+            # Same rows as the latest readings; connected is computed on ts_epoch in SQL
+            latest = self._get_latest_sensor_rows()
             devices = {}
             
-            if row:
-                date_str, time_str = row
-                reading_time = datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M:%S')
-                reading_time = self.cst_tz.localize(reading_time)
-                
-                current_time = datetime.now(self.cst_tz)
-                connected = (current_time - reading_time) < timedelta(minutes=5)
-                
-                # Check individual device status based on actual data
-                devices = {}
-                
-                # Check if we have recent data for each device
-                cursor.execute("""
-                    SELECT preheat, main_heat, rib_heat
-                    FROM readings 
-                    ORDER BY date DESC, timestamp DESC 
-                    LIMIT 1
-                """)
-                
-                data_row = cursor.fetchone()
-                if data_row:
-                    preheat_val, main_heat_val, rib_heat_val = data_row
-                    
-                    # Always show all three devices
-                    # Preheat
-                    if preheat_val is not None:
-                        devices['preheat'] = {
-                            'connected': connected,
-                            'last_reading': f"{date_str} {time_str}",
-                            'last_reading_dt': reading_time.isoformat()
-                        }
-                    else:
-                        # Check if we have any recent preheat data
-                        cursor.execute("""
-                            SELECT date, timestamp FROM readings 
-                            WHERE preheat IS NOT NULL 
-                            ORDER BY date DESC, timestamp DESC 
-                            LIMIT 1
-                        """)
-                        preheat_row = cursor.fetchone()
-                        if preheat_row:
-                            p_date, p_time = preheat_row
-                            p_reading_time = datetime.strptime(f"{p_date} {p_time}", '%Y-%m-%d %H:%M:%S')
-                            p_reading_time = self.cst_tz.localize(p_reading_time)
-                            p_connected = (current_time - p_reading_time) < timedelta(minutes=5)
-                            devices['preheat'] = {
-                                'connected': p_connected,
-                                'last_reading': f"{p_date} {p_time}",
-                                'last_reading_dt': p_reading_time.isoformat()
-                            }
-                        else:
-                            devices['preheat'] = {
-                                'connected': False,
-                                'last_reading': 'N/A',
-                                'last_reading_dt': None
-                            }
-                    
-                    # Main Heat
-                    if main_heat_val is not None:
-                        devices['main_heat'] = {
-                            'connected': connected,
-                            'last_reading': f"{date_str} {time_str}",
-                            'last_reading_dt': reading_time.isoformat()
-                        }
-                    else:
-                        # Check if we have any recent main_heat data
-                        cursor.execute("""
-                            SELECT date, timestamp FROM readings 
-                            WHERE main_heat IS NOT NULL 
-                            ORDER BY date DESC, timestamp DESC 
-                            LIMIT 1
-                        """)
-                        main_heat_row = cursor.fetchone()
-                        if main_heat_row:
-                            m_date, m_time = main_heat_row
-                            m_reading_time = datetime.strptime(f"{m_date} {m_time}", '%Y-%m-%d %H:%M:%S')
-                            m_reading_time = self.cst_tz.localize(m_reading_time)
-                            m_connected = (current_time - m_reading_time) < timedelta(minutes=5)
-                            devices['main_heat'] = {
-                                'connected': m_connected,
-                                'last_reading': f"{m_date} {m_time}",
-                                'last_reading_dt': m_reading_time.isoformat()
-                            }
-                        else:
-                            devices['main_heat'] = {
-                                'connected': False,
-                                'last_reading': 'N/A',
-                                'last_reading_dt': None
-                            }
-                    
-                    # Rib Heat
-                    if rib_heat_val is not None:
-                        devices['rib_heat'] = {
-                            'connected': connected,
+            if latest:
+                # Always show all three devices
+                for sensor in SENSOR_COLUMNS:
+                    if sensor in latest:
+                        date_str, time_str, _, connected = latest[sensor]
+                        reading_time = datetime.fromisoformat(f"{date_str} {time_str}").replace(tzinfo=self.cst_tz)
+                        devices[sensor] = {
+                            'connected': bool(connected),
                             'last_reading': f"{date_str} {time_str}",
-                            'last_reading_dt': reading_time.isoformat()
+                            'last_reading_dt': reading_time
                         }
                     else:
-                        # Show rib_heat as disconnected
-                        devices['rib_heat'] = {
+                        devices[sensor] = {
                             'connected': False,
                             'last_reading': 'N/A',
                             'last_reading_dt': None
                         }
             
-            conn.close()
-            
             return {
-                'timestamp': datetime.now(self.cst_tz).isoformat(),
+                'timestamp': datetime.now(self.cst_tz),
                 'devices': devices,
                 'system_status': 'running'
             }
@@ -497,59 +604,49 @@ class VulcanSentinelWebServer:
         except Exception as e:
             logger.error(f"Error getting system status: {e}")
             return {
-                'timestamp': datetime.now(self.cst_tz).isoformat(),
+                'timestamp': datetime.now(self.cst_tz),
                 'devices': {},
                 'system_status': 'error'
             }
     
-    def _get_historical_data(self, days=1):
-        """Get historical data from new schema"""
+    def _history_bucket_seconds(self, days):
+        """Pick the history bucket width so a chart gets roughly 1.5k-3k points per sensor"""
+        if days <= 1:
+            return 60
+        if days <= 7:
+            return 300
+        return 900
+    
+    def _get_historical_data(self, days=1, bucket_seconds=None):
+        """Get historical data from new schema, averaged into fixed-width time buckets, as per-sensor columns"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get data from the last N days
-            start_date = (datetime.now(self.cst_tz) - timedelta(days=days)).strftime('%Y-%m-%d')
-            
-            cursor.execute("""
-                SELECT date, timestamp, preheat, main_heat, rib_heat
-                FROM readings
-                WHERE date >= ?
-                ORDER BY date ASC, timestamp ASC
-            """, (start_date,))
-            
-            data = {
-                'preheat': [],
-                'main_heat': [],
-                'rib_heat': []  # Include rib_heat for chart display
-            }
-            
-            for row in cursor.fetchall():
-                date_str, time_str, preheat, main_heat, rib_heat = row
-                timestamp_str = f"{date_str} {time_str}"
+            with self._conn() as conn:
+                cursor = conn.cursor()
                 
-                if preheat is not None:
-                    data['preheat'].append({
-                        'temperature': preheat,
-                        'timestamp': timestamp_str
-                    })
+                # Get data from the last N days
+                start = int(time.time()) - days * 86400
                 
-                if main_heat is not None:
-                    data['main_heat'].append({
-                        'temperature': main_heat,
-                        'timestamp': timestamp_str
-                    })
+                # Downsample in SQLite: average each sensor per bucket and label the bucket
+                # with its start time. Rows are selected on ts_epoch, while buckets are cut on
+                # the stored wall-clock strings, which round-trip unchanged through
+                # strftime('%s') / datetime(..., 'unixepoch').
+                if bucket_seconds is None:
+                    bucket_seconds = self._history_bucket_seconds(days)
+                cursor.execute(_SQL_HISTORY_BUCKETS, {'bucket': bucket_seconds, 'start': start})
+                
+                # One pair of parallel, time-ordered arrays per sensor (rib_heat included for chart display)
+                data = {sensor: {'temperature': [], 'timestamp': []} for sensor in SENSOR_COLUMNS}
+                
+                # Bucket labels already come back as strings from SQL; comprehensions per sensor
+                # keep the per-row work out of interpreted loop bodies
+                while batch := cursor.fetchmany(FETCH_BATCH_SIZE):
+                    for column, sensor in enumerate(SENSOR_COLUMNS, start=1):
+                        series = data[sensor]
+                        series['temperature'] += [row[column] for row in batch if row[column] is not None]
+                        series['timestamp'] += [row[0] for row in batch if row[column] is not None]
+                
+                return data
                 
-                # Include rib_heat data if available
-                if rib_heat is not None:
-                    data['rib_heat'].append({
-                        'temperature': rib_heat,
-                        'timestamp': timestamp_str
-                    })
-            
-            conn.close()
-            return data
-            
         except Exception as e:
             logger.error(f"Error getting historical data: {e}")
             return {}
@@ -557,39 +654,29 @@ class VulcanSentinelWebServer:
     def _get_device_info(self):
         """Get device information"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get device statistics for temperature readings
-            cursor.execute("""
-                SELECT device_name, 
-                       COUNT(*) as reading_count,
-                       MIN(timestamp) as first_reading,
-                       MAX(timestamp) as last_reading,
-                       AVG(value) as avg_temperature,
-                       MIN(value) as min_temperature,
-                       MAX(value) as max_temperature
-                FROM readings
-                WHERE register_name = 'temperature'
-                GROUP BY device_name
-            """)
-            
-            devices = []
-            for row in cursor.fetchall():
-                device_name, count, first, last, avg, min_temp, max_temp = row
-                devices.append({
-                    'name': device_name,
-                    'reading_count': count,
-                    'first_reading': first,
-                    'last_reading': last,
-                    'avg_temperature': round(avg, 1) if avg else None,
-                    'min_temperature': min_temp,
-                    'max_temperature': max_temp
-                })
-            
-            conn.close()
-            return {'devices': devices}
-            
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                
+                # Get device statistics for temperature readings; each branch aggregates
+                # over that sensor's partial index
+                cursor.execute(_SQL_DEVICE_STATS)
+                
+                devices = []
+                for device_name, count, first, last, avg, min_temp, max_temp in cursor:
+                    if not count:
+                        continue
+                    devices.append({
+                        'name': device_name,
+                        'reading_count': count,
+                        'first_reading': first,
+                        'last_reading': last,
+                        'avg_temperature': avg,
+                        'min_temperature': min_temp,
+                        'max_temperature': max_temp
+                    })
+                
+                return {'devices': devices}
+                
         except Exception as e:
             logger.error(f"Error getting device info: {e}")
             return {'devices': []}
@@ -597,43 +684,47 @@ class VulcanSentinelWebServer:
     def _get_csv_data(self, device_name):
         """Download CSV data for a device from new schema"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get all temperature readings for the device
-            cursor.execute("""
-                SELECT date, timestamp, preheat, main_heat, rib_heat
-                FROM readings
-                WHERE preheat IS NOT NULL OR main_heat IS NOT NULL OR rib_heat IS NOT NULL
-                ORDER BY date DESC, timestamp DESC
-            """)
-            
-            # Create CSV in memory
-            output = StringIO()
-            writer = csv.writer(output)
-            writer.writerow(['date', 'timestamp', 'preheat', 'main_heat', 'rib_heat'])
-            
-            for row in cursor.fetchall():
-                date_str, time_str, preheat, main_heat, rib_heat = row
-                writer.writerow([
-                    date_str, 
-                    time_str, 
-                    preheat if preheat is not None else '',
-                    main_heat if main_heat is not None else '',
-                    rib_heat if rib_heat is not None else ''
-                ])
-            
-            conn.close()
-            
-            # Return CSV file using BytesIO
-            output.seek(0)
-            csv_data = output.getvalue().encode('utf-8')
-            return send_file(
-                BytesIO(csv_data),
-                mimetype='text/csv',
-                as_attachment=True,
-                download_name=f'temperature_data_{datetime.now().strftime("%Y%m%d")}.csv'
-            )
+            def generate():
+                """Yield the CSV header and then one encoded chunk per fetched batch of rows"""
+                # The connection stays checked out until the stream is finished or closed
+                with self._conn() as conn:
+                    # Get all temperature readings for the device
+                    cursor = conn.execute(_SQL_CSV_EXPORT)
+                    yield b'date,timestamp,preheat,main_heat,rib_heat\r\n'
+                    
+                    try:
+                        # Columns are ISO date/time strings and floats, so no field ever needs quoting.
+                        # Each fetched batch goes out as one chunk to keep per-write overhead low.
+                        while rows := cursor.fetchmany(FETCH_BATCH_SIZE):
+                            yield ''.join([
+                                f"{date_str},{time_str},"
+                                f"{'' if preheat is None else preheat},"
+                                f"{'' if main_heat is None else main_heat},"
+                                f"{'' if rib_heat is None else rib_heat}\r\n"
+                                for date_str, time_str, preheat, main_heat, rib_heat in rows
+                            ]).encode('utf-8')
+                    except Exception as e:
+                        # Re-raise so the server aborts the connection instead of
+                        # ending a 200 response with a silently truncated file
+                        logger.error(f"Error streaming CSV: {e}")
+                        raise
+            
+            # Run the query up front so a failure still produces an error response
+            rows = generate()
+            header = next(rows)
+            
+            # Stream the rows instead of building the whole file in memory
+            download_name = f'temperature_data_{datetime.now().strftime("%Y%m%d")}.csv'
+            body = itertools.chain([header], rows)
+            headers = {'Content-Disposition': f'attachment; filename={download_name}'}
+            
+            # flask-compress has no streaming gzip; cover clients that only accept gzip here
+            accepted = request.accept_encodings
+            if accepted['gzip'] and not any(accepted[a] for a in self.app.config['COMPRESS_ALGORITHM_STREAMING']):
+                body = _gzip_chunks(body, self.app.config['COMPRESS_LEVEL'])
+                headers['Content-Encoding'] = 'gzip'
+            
+            return Response(stream_with_context(body), mimetype='text/csv', headers=headers)
             
         except Exception as e:
             logger.error(f"Error generating CSV: {e}")
@@ -642,30 +733,43 @@ class VulcanSentinelWebServer:
     def _cleanup_duplicate_readings(self):
         """Clean up duplicate readings with the same timestamp in new schema"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Find and delete duplicate readings based on date and timestamp
-            cursor.execute("""
-                DELETE FROM readings 
-                WHERE id NOT IN (
-                    SELECT MIN(id) 
-                    FROM readings 
-                    GROUP BY date, timestamp
-                )
-            """)
-            
-            deleted_count = cursor.rowcount
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Cleaned up {deleted_count} duplicate readings")
-            return {
-                'success': True,
-                'deleted_count': deleted_count,
-                'message': f'Cleaned up {deleted_count} duplicate readings'
-            }
-            
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                batch_size = 10000
+                deleted_count = 0
+                
+                # Find and delete duplicate readings based on date and timestamp, keeping the
+                # first row of each group. Rows are numbered in one ordered pass over the
+                # (date, timestamp) index, and deleted in bounded batches so each transaction
+                # stays small and the poller can write in between.
+                while True:
+                    cursor.execute("BEGIN IMMEDIATE")
+                    try:
+                        cursor.execute(_SQL_DELETE_DUPLICATES, (batch_size,))
+                        # rowcount is not reported for statements that start with WITH
+                        batch_deleted = cursor.execute("SELECT changes()").fetchone()[0]
+                        cursor.execute("COMMIT")
+                    except Exception:
+                        cursor.execute("ROLLBACK")
+                        raise
+                    
+                    deleted_count += batch_deleted
+                    if batch_deleted < batch_size:
+                        break
+                
+                # Cached readings, history and storage figures may include the deleted rows,
+                # and a large delete can leave the planner statistics stale
+                if deleted_count:
+                    self._data_cache.clear()
+                    cursor.execute("PRAGMA optimize")
+                
+                logger.info(f"Cleaned up {deleted_count} duplicate readings")
+                return {
+                    'success': True,
+                    'deleted_count': deleted_count,
+                    'message': f'Cleaned up {deleted_count} duplicate readings'
+                }
+                
         except Exception as e:
             logger.error(f"Error cleaning up duplicates: {e}")
             return {
@@ -704,51 +808,20 @@ class VulcanSentinelWebServer:
             record_count = 0
             oldest_record = None
             newest_record = None
+            daily_record_count = 0
             
-            if os.path.exists(self.db_path):
-                try:
+            try:
+                if os.path.exists(self.db_path):
                     db_size = os.path.getsize(self.db_path)
                     
-                    conn = sqlite3.connect(self.db_path)
-                    cursor = conn.cursor()
+                    with self._conn() as conn:
+                        cursor = conn.cursor()
+                        
+                        # Record count, oldest/newest record and last-24h count in one statement
+                        cursor.execute(_SQL_STORAGE_STATS, (int(time.time()) - 86400,))
+                        
+                        record_count, oldest_record, newest_record, daily_record_count = cursor.fetchone()
                     
-                    # Get record count
-                    cursor.execute("SELECT COUNT(*) FROM readings")
-                    record_count = cursor.fetchone()[0]
-                    
-                    # Get oldest and newest records
-                    if record_count > 0:
-                        cursor.execute("SELECT MIN(date || ' ' || timestamp), MAX(date || ' ' || timestamp) FROM readings")
-                        oldest, newest = cursor.fetchone()
-                        if oldest:
-                            oldest_record = oldest
-                        if newest:
-                            newest_record = newest
-                    
-                    conn.close()
-                except Exception as e:
-                    logger.error(f"Error getting database info: {e}")
-                    db_size = 0
-                    record_count = 0
-            
-            # Calculate data consumption for last 24 hours
-            try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                
-                # Get data from the last 24 hours
-                start_date = datetime.now(self.cst_tz) - timedelta(days=1)
-                start_date_str = start_date.strftime('%Y-%m-%d')
-                
-                cursor.execute("""
-                    SELECT COUNT(*) as record_count
-                    FROM readings
-                    WHERE date >= ?
-                """, (start_date_str,))
-                
-                daily_record_count = cursor.fetchone()[0]
-                conn.close()
-                
                 # Estimate data size (rough calculation)
                 estimated_size_mb = (daily_record_count * 100) / (1024 * 1024)  # ~100 bytes per record
                 
@@ -758,7 +831,11 @@ class VulcanSentinelWebServer:
                     'status': 'Active' if daily_record_count > 0 else 'No recent data'
                 }
             except Exception as e:
-                logger.error(f"Error calculating data consumption: {e}")
+                logger.error(f"Error getting database info: {e}")
+                db_size = 0
+                record_count = 0
+                oldest_record = None
+                newest_record = None
                 data_consumption = {
                     'daily_records': 0,
                     'daily_size_mb': 0,
@@ -774,48 +851,16 @@ class VulcanSentinelWebServer:
                     'newest_record': newest_record
                 },
                 'data_consumption': data_consumption,
-                'timestamp': datetime.now(self.cst_tz).isoformat()
+                'timestamp': datetime.now(self.cst_tz)
             }
             
         except Exception as e:
             logger.error(f"Error getting storage info: {e}")
             return {
                 'error': str(e),
-                'timestamp': datetime.now(self.cst_tz).isoformat()
+                'timestamp': datetime.now(self.cst_tz)
             }
     
-    def _calculate_data_consumption(self, days):
-        """Calculate data consumption for the specified number of days"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Get data from the last N days
-            start_date = datetime.now(self.cst_tz) - timedelta(days=days)
-            
-            # Convert timezone-aware datetime to naive datetime for database comparison
-            if start_date.tzinfo is not None:
-                start_date = start_date.replace(tzinfo=None)
-            
-            cursor.execute("""
-                SELECT COUNT(*) as record_count
-                FROM readings
-                WHERE timestamp >= ?
-            """, (start_date,))
-            
-            record_count = cursor.fetchone()[0]
-            conn.close()
-            
-            # Estimate data size (rough calculation)
-            # Each record: ~100 bytes (timestamp, device_name, register_name, value)
-            estimated_size = record_count * 100
-            
-            return estimated_size
-            
-        except Exception as e:
-            logger.error(f"Error calculating data consumption: {e}")
-            return 0
-    
     def _generate_report(self):
         """Generate a work order report"""
         try:
@@ -845,10 +890,8 @@ class VulcanSentinelWebServer:
                 
                 # Convert to CST timezone for consistency with stored data
                 # We need to assume the input times are in CST since that's what we're using throughout
-                import pytz
-                cst_tz = pytz.timezone('America/Chicago')
-                start_time = cst_tz.localize(start_time)
-                end_time = cst_tz.localize(end_time)
+                start_time = start_time.replace(tzinfo=self.cst_tz)
+                end_time = end_time.replace(tzinfo=self.cst_tz)
                 
                 logger.info(f"Report time range: {start_time} to {end_time}")
                 
@@ -898,13 +941,7 @@ class VulcanSentinelWebServer:
                 return jsonify({"error": "Report generator not available"})
             
             # Get report metadata
-            history = self.report_generator.get_report_history(1000)
-            report_metadata = None
-            
-            for report in history:
-                if report.get('report_id') == report_id:
-                    report_metadata = report
-                    break
+            report_metadata = self.report_generator.get_report_by_id(report_id)
             
             if not report_metadata:
                 return jsonify({"error": "Report not found"})
@@ -953,8 +990,8 @@ class VulcanSentinelWebServer:
     
     def start(self):
         """Start the web server"""
-        logger.info(f"Starting Vulcan Sentinel web server on {self.host}:{self.port}")
-        self.app.run(host=self.host, port=self.port, debug=False, threaded=True)
+        logger.info(f"Starting Vulcan Sentinel web server on {self.host}:{self.port} ({self.threads} threads)")
+        serve(self.app, host=self.host, port=self.port, threads=self.threads)
     
     def stop(self):
         """Stop the web server"""
@@ -10,7 +10,10 @@ import os
 import sys
 import logging
 from datetime import datetime, timedelta
-import random
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -24,120 +27,137 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Shared-cache in-memory database, visible to every connection in this process
+TEST_DB_URI = "file:vulcan_sentinel_test?mode=memory&cache=shared"
+
+# Fixed seed so every run generates the same sample readings
+SAMPLE_SEED = 42
+
+# Base temperature and spread of the synthetic readings for each sensor
+SAMPLE_TEMPERATURE_RANGES = {
+    'preheat': (250, -20, 30),
+    'main_heat': (350, -30, 40),
+    'rib_heat': (300, -25, 35),
+}
+
+
 def generate_sample_data(db_manager, start_time, end_time):
     """Generate sample temperature data for testing"""
     logger.info("Generating sample temperature data...")
     
     # Sample data for the three sensors
-    sensors = ['preheat', 'main_heat', 'rib_heat']
-    
-    current_time = start_time
-    while current_time <= end_time:
-        for sensor in sensors:
-            # Generate realistic temperature values
-            if sensor == 'preheat':
-                base_temp = 250 + random.uniform(-20, 30)
-            elif sensor == 'main_heat':
-                base_temp = 350 + random.uniform(-30, 40)
-            else:  # rib_heat
-                base_temp = 300 + random.uniform(-25, 35)
-            
-            # Add some noise
-            temp = base_temp + random.uniform(-5, 5)
-            
-            # Store the reading
-            db_manager.store_readings(sensor, current_time, {'temperature': temp})
-        
-        # Log some events
-        if current_time.minute % 5 == 0:  # Every 5 minutes
-            db_manager.log_event(
-                event_type="TEMP_REACHED",
-                message=f"Temperature target reached for {sensors[0]}",
-                severity="INFO",
-                device_name=sensors[0]
-            )
-        
-        if current_time.minute % 10 == 0:  # Every 10 minutes
-            db_manager.log_event(
-                event_type="MANUAL_OVERRIDE",
-                message="Set temperature manually adjusted",
-                severity="WARNING",
-                device_name=sensors[1]
-            )
-        
-        current_time += timedelta(seconds=20)  # 20-second intervals
+    sensors = list(SAMPLE_TEMPERATURE_RANGES)
+    rng = np.random.default_rng(SAMPLE_SEED)
+    
+    # One tick every 20 seconds, end time included, computed from UNIX offsets
+    n = int((end_time - start_time).total_seconds() // 20) + 1
+    offsets = np.arange(n) * 20
+    unix0 = start_time.timestamp()
+    timestamps = [datetime.fromtimestamp(unix0 + offset, tz=start_time.tzinfo) for offset in offsets.tolist()]
+    
+    # Minute of the hour for every tick, used to schedule the events below
+    minutes = ((start_time.minute * 60 + start_time.second + offsets) // 60) % 60
+    
+    # Generate realistic temperature values, with some noise, for all ticks at once
+    temperatures = {
+        sensor: (base + rng.uniform(low, high, n) + rng.uniform(-5, 5, n)).tolist()
+        for sensor, (base, low, high) in SAMPLE_TEMPERATURE_RANGES.items()
+    }
+    readings_buf = [
+        (timestamp, {sensor: temperatures[sensor][i] for sensor in sensors})
+        for i, timestamp in enumerate(timestamps)
+    ]
+    
+    # Log some events; the schedule is fixed, so count the ticks for each cadence up front
+    evt5_count = int(np.count_nonzero(minutes % 5 == 0))  # Every 5 minutes
+    evt10_count = int(np.count_nonzero(minutes % 10 == 0))  # Every 10 minutes
+    events_buf = (
+        [("TEMP_REACHED", f"Temperature target reached for {sensors[0]}", "INFO", sensors[0])] * evt5_count
+        + [("MANUAL_OVERRIDE", "Set temperature manually adjusted", "WARNING", sensors[1])] * evt10_count
+    )
+    
+    # Write everything in one transaction per table
+    db_manager.store_readings_bulk(readings_buf)
+    db_manager.log_events_bulk(events_buf)
     
     logger.info("Sample data generation completed")
 
 
+@pytest.mark.integration
 def test_report_generation():
     """Test the report generation functionality"""
-    try:
-        logger.info("Starting report generation test...")
-        
-        # Initialize components
-        config_manager = ConfigManager()
-        db_manager = DatabaseManager()
-        report_generator = ReportGenerator(db_manager, config_manager)
-        
-        # Create database tables
-        db_manager.create_tables()
-        
-        # Generate sample data for the last hour
-        end_time = datetime.now()
-        start_time = end_time - timedelta(hours=1)
-        
-        generate_sample_data(db_manager, start_time, end_time)
-        
-        # Test PDF report generation
-        logger.info("Generating PDF report...")
-        pdf_report = report_generator.generate_work_order_report(
-            work_order_number="WO-TEST-001",
-            start_time=start_time,
-            end_time=end_time,
-            machine_id="Line-07",
-            output_format="pdf"
-        )
-        
-        logger.info(f"PDF report generated: {pdf_report['file_path']}")
-        logger.info(f"Report ID: {pdf_report['report_id']}")
-        
-        # Test thermal report generation
-        logger.info("Generating thermal report...")
-        thermal_report = report_generator.generate_work_order_report(
-            work_order_number="WO-TEST-002",
-            start_time=start_time,
-            end_time=end_time,
-            machine_id="Line-07",
-            output_format="thermal"
-        )
-        
-        logger.info(f"Thermal report generated: {thermal_report['file_path']}")
-        logger.info(f"Report ID: {thermal_report['report_id']}")
-        
-        # Test report history
-        logger.info("Getting report history...")
-        history = report_generator.get_report_history(10)
-        logger.info(f"Found {len(history)} reports in history")
-        
-        for report in history:
-            logger.info(f"  - Report {report['report_id']}: {report['work_order_number']}")
-        
-        # Test CSV export
-        if history:
-            logger.info("Testing CSV export...")
-            csv_path = report_generator.export_report_csv(history[0]['report_id'])
-            logger.info(f"CSV exported to: {csv_path}")
-        
-        logger.info("Report generation test completed successfully!")
-        
-        return True
-        
-    except Exception as e:
-        logger.error(f"Test failed: {e}")
-        return False
+    logger.info("Starting report generation test...")
+    
+    # Initialize components; the sample data goes to a throwaway in-memory
+    # database so the test never touches the production file or waits on disk syncs
+    config_manager = ConfigManager()
+    db_manager = DatabaseManager(TEST_DB_URI)
+    report_generator = ReportGenerator(db_manager, config_manager)
+    
+    # Create database tables
+    db_manager.create_tables()
+    
+    # Generate sample data for the last hour, in the plant's timezone like the stored readings
+    end_time = datetime.now(ZoneInfo('America/Chicago')).replace(microsecond=0)
+    start_time = end_time - timedelta(hours=1)
+    
+    generate_sample_data(db_manager, start_time, end_time)
+    
+    # One reading every 20 seconds, end time included, for every sensor
+    tick_count = 3600 // 20 + 1
+    for sensor in SAMPLE_TEMPERATURE_RANGES:
+        assert len(db_manager.get_readings_range(sensor, start_time, end_time)) == tick_count
+    
+    # Events on every tick inside a 5 / 10 minute mark
+    tick_minutes = [(start_time + timedelta(seconds=20 * i)).minute for i in range(tick_count)]
+    events = db_manager.get_events(limit=10000)
+    assert sum(e['event_type'] == 'TEMP_REACHED' for e in events) == sum(m % 5 == 0 for m in tick_minutes)
+    assert sum(e['event_type'] == 'MANUAL_OVERRIDE' for e in events) == sum(m % 10 == 0 for m in tick_minutes)
+    
+    # Test PDF report generation
+    logger.info("Generating PDF report...")
+    pdf_report = report_generator.generate_work_order_report(
+        work_order_number="WO-TEST-001",
+        start_time=start_time,
+        end_time=end_time,
+        machine_id="Line-07",
+        output_format="pdf"
+    )
+    
+    logger.info(f"PDF report generated: {pdf_report['file_path']}")
+    assert pdf_report['work_order_number'] == "WO-TEST-001"
+    assert os.path.isfile(pdf_report['file_path'])
+    
+    # Test thermal report generation
+    logger.info("Generating thermal report...")
+    thermal_report = report_generator.generate_work_order_report(
+        work_order_number="WO-TEST-002",
+        start_time=start_time,
+        end_time=end_time,
+        machine_id="Line-07",
+        output_format="thermal"
+    )
+    
+    logger.info(f"Thermal report generated: {thermal_report['file_path']}")
+    assert thermal_report['work_order_number'] == "WO-TEST-002"
+    assert thermal_report['report_id'] != pdf_report['report_id']
+    assert os.path.isfile(thermal_report['file_path'])
+    
+    # Test report history; newest first
+    logger.info("Getting report history...")
+    history = report_generator.get_report_history(10)
+    logger.info(f"Found {len(history)} reports in history")
+    assert [r['report_id'] for r in history[:2]] == [thermal_report['report_id'], pdf_report['report_id']]
+    
+    # Test CSV export: a header plus one line per reading in the report window
+    logger.info("Testing CSV export...")
+    csv_path = report_generator.export_report_csv(thermal_report['report_id'])
+    logger.info(f"CSV exported to: {csv_path}")
+    with open(csv_path) as f:
+        assert sum(1 for _ in f) == tick_count + 1
+    
+    logger.info("Report generation test completed successfully!")
 
 
 if __name__ == "__main__":
-    success = test_report_generation()
-    sys.exit(0 if success else 1)
+    test_report_generation()
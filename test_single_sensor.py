@@ -3,57 +3,71 @@
 Test script using exact same method as working single sensor script
 """
 
-import time
+import asyncio
 import sys
-from datetime import datetime
-from pymodbus.client import ModbusTcpClient
-from pymodbus.payload import BinaryPayloadDecoder
-from pymodbus.constants import Endian
+import time
+from pymodbus.client import AsyncModbusTcpClient
+
+from src.modbus_poller import decode_float
+
+# One client per sensor IP, reused across reads and test runs
+_clients = {}
+
+async def get_client(ip):
+    client = _clients.get(ip)
+    if client is None:
+        # Fail fast on an unreachable sensor instead of waiting out the default timeout
+        client = _clients[ip] = AsyncModbusTcpClient(ip, port=502, timeout=1)
+    if not client.connected and not await client.connect():
+        return None
+    return client
+
+def close_clients():
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
 
-def test_sensor(ip, name):
+async def test_sensor(ip, name):
     print(f"Testing {name} at {ip}")
-    client = ModbusTcpClient(ip, port=502)
+    client = await get_client(ip)
 
-    if not client.connect():
+    if client is None:
         print(f"Failed to connect to {name}.")
         return False
 
     try:
         for i in range(5):  # Test 5 readings
-            result = client.read_input_registers(402, 2, slave=1)
+            result = await client.read_input_registers(402, 2, slave=1)
             if not result.isError():
-                decoder = BinaryPayloadDecoder.fromRegisters(
-                    result.registers,
-                    byteorder=Endian.Big,
-                    wordorder=Endian.Little
-                )
-                temp = decoder.decode_32bit_float()
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                temp = decode_float(result.registers)
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
                 print(f"[{timestamp}] {name}: {temp} °F")
             else:
                 print(f"Error reading temperature from {name}")
 
-            time.sleep(2)
+            await asyncio.sleep(2)
 
     except Exception as e:
         print(f"Exception reading {name}: {e}")
         print(f"Exception type: {type(e).__name__}")
         return False
-
-    finally:
-        client.close()
     
     return True
 
 if __name__ == "__main__":
     print("Testing sensors with exact same method as working script...")
     
-    # Test preheat sensor
-    test_sensor("169.254.100.100", "preheat")
-    print()
-    
-    # Test main_heat sensor  
-    test_sensor("169.254.100.200", "main_heat")
+    # Test the preheat and main_heat sensors side by side in one event loop; the
+    # reads and sleeps of one sensor overlap with the other's
+    sensors = [("169.254.100.100", "preheat"), ("169.254.100.200", "main_heat")]
+
+    async def test_all():
+        try:
+            return await asyncio.gather(*(test_sensor(ip, name) for ip, name in sensors))
+        finally:
+            close_clients()
+
+    asyncio.run(test_all())
     print()
     
     print("Test completed.") 
\ No newline at end of file
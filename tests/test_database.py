@@ -0,0 +1,62 @@
+"""
+Unit tests for DatabaseManager
+"""
+
+import sqlite3
+import calendar
+from datetime import datetime
+
+import pytest
+from src.database import DatabaseManager
+
+pytestmark = pytest.mark.unit
+
+
+class TestReadingsEpochMigration:
+    """Test the ts_epoch migration of readings tables created before the column existed"""
+
+    @pytest.fixture
+    def legacy_db_path(self, tmp_path):
+        """Database file with the original readings schema and a few rows"""
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE readings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date DATE NOT NULL,
+                timestamp TIME NOT NULL,
+                preheat REAL,
+                main_heat REAL,
+                rib_heat REAL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO readings (date, timestamp, preheat, main_heat, rib_heat) VALUES (?, ?, ?, ?, ?)",
+            [
+                ('2024-01-15', '12:00:00', 250.0, None, None),  # CST, UTC-6
+                ('2024-07-15', '12:00:00', None, 350.0, None),  # CDT, UTC-5
+                ('2024-07-15', '23:59:40', None, None, 300.0),
+            ]
+        )
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_create_tables_backfills_ts_epoch(self, legacy_db_path):
+        """Test create_tables adds ts_epoch, fills it from the CST wall-clock columns and indexes it"""
+        DatabaseManager(legacy_db_path).create_tables()
+
+        conn = sqlite3.connect(legacy_db_path)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(readings)")}
+        epochs = dict(conn.execute("SELECT date || ' ' || timestamp, ts_epoch FROM readings"))
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+
+        assert 'ts_epoch' in columns
+        assert epochs == {
+            '2024-01-15 12:00:00': calendar.timegm(datetime(2024, 1, 15, 18, 0, 0).timetuple()),
+            '2024-07-15 12:00:00': calendar.timegm(datetime(2024, 7, 15, 17, 0, 0).timetuple()),
+            '2024-07-15 23:59:40': calendar.timegm(datetime(2024, 7, 16, 4, 59, 40).timetuple()),
+        }
+        assert 'idx_readings_ts_epoch' in indexes
@@ -3,10 +3,12 @@ Unit tests for Modbus Poller
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call
 from datetime import datetime
 from src.modbus_poller import ModbusPoller, ModbusDevice
 
+pytestmark = pytest.mark.unit
+
 
 class TestModbusDevice:
     """Test ModbusDevice dataclass"""
@@ -47,7 +49,8 @@ class TestModbusPoller:
                     'port': 502,
                     'slave_id': 1,
                     'registers': {
-                        'temperature': 402
+                        'temperature': 402,
+                        'pressure': 404
                     },
                     'polling_interval': 20
                 }
@@ -57,14 +60,12 @@ class TestModbusPoller:
     @pytest.fixture
     def poller(self, mock_config):
         """Create a ModbusPoller instance with mocked dependencies"""
-        with patch('src.modbus_poller.ConfigManager') as mock_config_manager, \
-             patch('src.modbus_poller.DatabaseManager') as mock_db_manager:
-            
-            mock_config_manager.return_value.load_config.return_value = mock_config
-            mock_db_manager.return_value.create_tables.return_value = None
-            
-            poller = ModbusPoller()
-            return poller
+        mock_config_manager = Mock()
+        mock_config_manager.load_devices_config.return_value = mock_config
+        mock_db_manager = Mock()
+        mock_db_manager.create_tables.return_value = None
+        
+        return ModbusPoller(config_manager=mock_config_manager, db_manager=mock_db_manager)
     
     def test_poller_initialization(self, poller, mock_config):
         """Test ModbusPoller initialization"""
@@ -102,46 +103,50 @@ class TestModbusPoller:
             assert result is False
             assert device.connection_status is False
     
-    def test_read_register_success(self, poller):
-        """Test successful register reading"""
+    @pytest.fixture
+    def connected_device(self, poller):
+        """Device with a mocked client whose socket is already open"""
         device = poller.devices['sensor_1']
-        mock_client = Mock()
-        mock_client.is_socket_open.return_value = True
-        
-        mock_result = Mock()
-        mock_result.isError.return_value = False
-        mock_result.registers = [0x4228, 0x0000]  # Example 32-bit float value
-        
-        mock_client.read_input_registers.return_value = mock_result
-        device.client = mock_client
+        device.client = Mock()
+        device.client.is_socket_open.return_value = True
         device.connection_status = True
-        
-        with patch('src.modbus_poller.BinaryPayloadDecoder') as mock_decoder:
-            mock_decoder_instance = Mock()
-            mock_decoder_instance.decode_32bit_float.return_value = 42.5
-            mock_decoder.fromRegisters.return_value = mock_decoder_instance
-            
-            result = poller._read_register(device, 'temperature', 402)
-            
-            assert result == 42.5
-            mock_client.read_input_registers.assert_called_once_with(402, 2, slave=1)
+        return device
     
-    def test_read_register_error(self, poller):
-        """Test register reading error"""
-        device = poller.devices['sensor_1']
-        mock_client = Mock()
-        mock_client.is_socket_open.return_value = True
-        
+    @pytest.mark.parametrize("is_error,registers,expected", [
+        (False, [0x0000, 0x4228, 0x0000, 0x4296], {'temperature': 42.0, 'pressure': 75.0}),  # low word first
+        (True, None, {}),
+    ])
+    def test_read_registers(self, poller, connected_device, is_error, registers, expected):
+        """Test adjacent registers are fetched in one request, and a read error yields no values"""
         mock_result = Mock()
-        mock_result.isError.return_value = True
+        mock_result.isError.return_value = is_error
+        mock_result.registers = registers
+        connected_device.client.read_input_registers.return_value = mock_result
         
-        mock_client.read_input_registers.return_value = mock_result
-        device.client = mock_client
-        device.connection_status = True
+        result = poller._read_registers(connected_device, {'temperature': 402, 'pressure': 404})
+        
+        assert result == expected
+        connected_device.client.read_input_registers.assert_called_once_with(402, 4, slave=1)
+    
+    @pytest.mark.parametrize("registers", [
+        {'temperature': 402, 'pressure': 600},  # too far apart for one read
+        {'temperature': 402, 'pressure': 410},  # unmapped addresses in between
+    ])
+    def test_read_registers_separate_blocks(self, poller, connected_device, registers):
+        """Test registers that aren't back to back are fetched in separate requests"""
+        first, second = Mock(), Mock()
+        first.isError.return_value = second.isError.return_value = False
+        first.registers = [0x0000, 0x4228]
+        second.registers = [0x0000, 0x4296]
+        connected_device.client.read_input_registers.side_effect = [first, second]
         
-        result = poller._read_register(device, 'temperature', 402)
+        result = poller._read_registers(connected_device, registers)
         
-        assert result is None
+        assert result == {'temperature': 42.0, 'pressure': 75.0}
+        assert connected_device.client.read_input_registers.call_args_list == [
+            call(402, 2, slave=1),
+            call(registers['pressure'], 2, slave=1),
+        ]
     
     def test_get_status(self, poller):
         """Test getting poller status"""